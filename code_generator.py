@@ -41,6 +41,9 @@ Examples:
   # Generate CRUD with specific actions
   python code_generator.py crud Product --actions create list retrieve
 
+  # Generate CRUD with fields backed by a unique index
+  python code_generator.py crud Product --unique-fields sku
+
   # Copy a built-in application
   python code_generator.py builtin user
 
@@ -73,6 +76,13 @@ Examples:
         help=f"HTTP actions to generate (default: {', '.join(CRUD_CONFIG.actions)})",
     )
 
+    parser.add_argument(
+        "--unique-fields",
+        nargs="+",
+        default=None,
+        help="Fields backed by a unique index (duplicates return 409)",
+    )
+
     parser.add_argument(
         "-v",
         "--verbose",
@@ -117,19 +127,25 @@ def validate_args(args: argparse.Namespace, parser: argparse.ArgumentParser) ->
             )
 
 
-def handle_crud_generation(model_name: str, actions: Optional[list[str]] = None) -> None:
+def handle_crud_generation(
+    model_name: str,
+    actions: Optional[list[str]] = None,
+    unique_fields: Optional[list[str]] = None,
+) -> None:
     """
     Handle CRUD generation.
 
     Args:
         model_name: Model name (can be PascalCase or snake_case)
         actions: Optional list of CRUD actions
+        unique_fields: Optional list of fields backed by a unique index
     """
     try:
         factory = GeneratorFactory()
         generator = factory.create_crud_generator(
             model_name=model_name,
             actions=actions,
+            unique_fields=unique_fields,
         )
         generator.run()
         logger.info(f"✓ CRUD generation completed for {model_name}")
@@ -202,7 +218,7 @@ def main() -> None:
 
         # Handle specific generator type
         if args.type == GeneratorType.CRUD:
-            handle_crud_generation(args.model_name, args.actions)
+            handle_crud_generation(args.model_name, args.actions, args.unique_fields)
 
         elif args.type == GeneratorType.BUILTIN:
             handle_builtin_generation(args.model_name)
@@ -4,7 +4,9 @@ from pydantic import BaseModel
 class AuthUser(BaseModel):
     id: int
     email: str
-    password: str
+    password: str | None = None
+    role_ids: list[int] = []
+    permission_mask: int | None = None
 
 
 class AuthRequest(BaseModel):
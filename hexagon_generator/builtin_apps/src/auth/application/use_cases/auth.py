@@ -1,28 +1,57 @@
 import os
 from datetime import datetime, timedelta
 
-import bcrypt
 import jwt
 
 from src.auth.application.schemas import AuthUser
+from src.auth.domain.permission_claims import PermissionClaims
+from src.auth.domain.principal_cache import PrincipalCache
 from src.auth.domain.repository import AuthRepository
 from src.auth.domain.exceptions import InvalidTokenException, UserNotFoundException
+from src.common.password_hasher import password_hasher
 
 
 class AuthUseCase:
-    def __init__(self, *, auth_repo: AuthRepository):
+    def __init__(
+        self,
+        *,
+        auth_repo: AuthRepository,
+        principal_cache: PrincipalCache | None = None,
+        permission_claims: PermissionClaims | None = None,
+    ):
         self.auth_repo = auth_repo
+        self.principal_cache = principal_cache
+        self.permission_claims = permission_claims
         self.secret_key = os.getenv("SECRET_KEY")
         self.algorithm = os.getenv("ALGORITHM")
         self.access_token_expire_minutes = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+        self.stateless_tokens = (
+            os.getenv("AUTH_STATELESS_TOKENS", "false").lower() == "true"
+        )
+        # Embedded permissions are only re-checked when the shared permission
+        # versions move, so these tokens still expire quickly.
+        self.stateless_token_expire_minutes = int(
+            os.getenv("STATELESS_TOKEN_EXPIRE_MINUTES", "10")
+        )
 
     async def authenticate_user(self, *, email: str, password: str) -> str:
         user = await self.auth_repo.get_user_by_email(email)
-        if not user or not self._verify_password(password, user.password):
+        if not user or not await self._verify_password(password, user.password):
             raise InvalidTokenException()
-        return self._create_access_token(data={"sub": user.email})
+
+        permission_claims = None
+        if self.stateless_tokens and self.permission_claims:
+            permission_claims = await self.permission_claims.build_claims(user)
+        return self._create_access_token(
+            data={"sub": user.email}, permission_claims=permission_claims
+        )
 
     async def get_current_user(self, *, token: str) -> AuthUser:
+        if self.principal_cache and not self.stateless_tokens:
+            cached_user = self.principal_cache.get(token)
+            if cached_user:
+                return cached_user
+
         try:
             payload = jwt.decode(
                 token, self.secret_key, algorithms=[self.algorithm]
@@ -30,21 +59,33 @@ class AuthUseCase:
             email = payload.get("sub")
             if not email:
                 raise InvalidTokenException()
+            # With the flag off, tokens issued while it was on fall back to
+            # the user lookup instead of trusting their embedded permissions.
+            if self.stateless_tokens and self.permission_claims and "perms" in payload:
+                user = await self.permission_claims.read_claims(payload)
+                if user:
+                    return user
             user = await self.auth_repo.get_user_by_email(email)
             if not user:
                 raise UserNotFoundException()
+            if self.principal_cache:
+                self.principal_cache.set(token, user, expires_at=payload["exp"])
             return user
         except jwt.PyJWTError:
             raise InvalidTokenException()
 
-    def _create_access_token(self, *, data: dict) -> str:
+    def _create_access_token(
+        self, *, data: dict, permission_claims: dict | None = None
+    ) -> str:
         to_encode = data.copy()
-        expire = datetime.now() + timedelta(minutes=self.access_token_expire_minutes)
+        expire_minutes = self.access_token_expire_minutes
+        if permission_claims:
+            to_encode.update(permission_claims)
+            expire_minutes = self.stateless_token_expire_minutes
+        expire = datetime.now() + timedelta(minutes=expire_minutes)
         to_encode.update({"exp": expire})
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
     @staticmethod
-    def _verify_password(plain_password: str, hashed_password: str) -> bool:
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
-        )
+    async def _verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
@@ -3,24 +3,34 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.application.use_cases.auth import AuthUseCase
+from src.auth.dependencies.permission_checker import permission_checker
 from src.auth.infrastructure.database import ORMAuthRepository
+from src.auth.infrastructure.permission_claims import JWTPermissionClaims
+from src.auth.infrastructure.principal_cache import principal_cache
 from src.common.database_connection import get_db
+from src.role.infrastructure.permission_resolver import permission_resolver
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
 
 def get_auth_use_case(db: AsyncSession = Depends(get_db)) -> AuthUseCase:
-    return AuthUseCase(auth_repo=ORMAuthRepository(db=db))
+    return AuthUseCase(
+        auth_repo=ORMAuthRepository(db=db),
+        principal_cache=principal_cache,
+        permission_claims=JWTPermissionClaims(db=db),
+    )
 
 
 def get_user_with_permission(required_permission: str):
     async def get_current_active_user(
         token: str = Depends(oauth2_scheme),
         auth_use_case: AuthUseCase = Depends(get_auth_use_case),
+        db: AsyncSession = Depends(get_db),
     ):
         user = await auth_use_case.get_current_user(token=token)
-        # permission_checker(permission=required_permission, user=user)
+        await permission_resolver.ensure_loaded(db)
+        permission_checker(permission=required_permission, user=user)
         return user
 
     return get_current_active_user
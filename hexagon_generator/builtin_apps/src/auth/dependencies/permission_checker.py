@@ -0,0 +1,16 @@
+from src.auth.application.schemas import AuthUser
+from src.auth.domain.exceptions import PermissionDeniedException
+from src.role.infrastructure.permission_resolver import permission_resolver
+
+
+def permission_checker(*, permission: str, user: AuthUser) -> None:
+    if user.permission_mask is not None:
+        allowed = permission_resolver.mask_has_permission(
+            mask=user.permission_mask, permission=permission
+        )
+    else:
+        allowed = permission_resolver.has_permission(
+            role_ids=user.role_ids, permission=permission
+        )
+    if not allowed:
+        raise PermissionDeniedException()
@@ -11,6 +11,10 @@ class UserNotFoundException(Exception):
     pass
 
 
+class PermissionDeniedException(Exception):
+    pass
+
+
 async def invalid_token_handler(request: Request, exc: InvalidTokenException):
     return std_response(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -29,7 +33,17 @@ async def user_not_found_handler(request: Request, exc: UserNotFoundException):
     )
 
 
+async def permission_denied_handler(request: Request, exc: PermissionDeniedException):
+    return std_response(
+        status_code=status.HTTP_403_FORBIDDEN,
+        ok=False,
+        msg="Permission denied",
+        data=None,
+    )
+
+
 EXCEPTIONS_AUTH_MAPPING = [
     (invalid_token_handler, InvalidTokenException),
     (user_not_found_handler, UserNotFoundException),
+    (permission_denied_handler, PermissionDeniedException),
 ]
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from src.auth.application.schemas import AuthUser
+
+
+class PermissionClaims(ABC):
+    @abstractmethod
+    async def build_claims(self, user: AuthUser) -> dict: ...
+
+    @abstractmethod
+    async def read_claims(self, payload: dict) -> AuthUser | None:
+        """The principal carried by the token, or None when it is stale."""
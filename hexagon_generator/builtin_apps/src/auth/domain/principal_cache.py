@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+
+from src.auth.application.schemas import AuthUser
+
+
+class PrincipalCache(ABC):
+    @abstractmethod
+    def get(self, token: str) -> AuthUser | None: ...
+
+    @abstractmethod
+    def set(self, token: str, user: AuthUser, *, expires_at: float) -> None: ...
+
+    @abstractmethod
+    def invalidate_user(self, user_id: int) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict: ...
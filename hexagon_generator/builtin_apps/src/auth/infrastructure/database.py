@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.application.schemas import AuthUser
 from src.auth.domain.repository import AuthRepository
-from src.user.infrastructure.models import UserORM
+from src.user.infrastructure.models import UserORM, UserRoleAssociation
 
 
 class ORMAuthRepository(AuthRepository):
@@ -18,8 +18,14 @@ class ORMAuthRepository(AuthRepository):
         if not orm_obj:
             return None
 
+        roles_stmt = select(UserRoleAssociation.role_id).where(
+            UserRoleAssociation.user_id == orm_obj.id
+        )
+        roles_result = await self.db.execute(roles_stmt)
+
         return AuthUser(
             id=orm_obj.id,
             email=orm_obj.email,
             password=orm_obj.password,
+            role_ids=list(roles_result.scalars().all()),
         )
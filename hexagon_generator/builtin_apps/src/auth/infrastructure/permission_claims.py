@@ -0,0 +1,64 @@
+import base64
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.auth.application.schemas import AuthUser
+from src.auth.domain.exceptions import InvalidTokenException
+from src.auth.domain.permission_claims import PermissionClaims
+from src.role.infrastructure.permission_resolver import (
+    ROLES_VERSION,
+    USERS_VERSION,
+    permission_resolver,
+)
+
+
+class JWTPermissionClaims(PermissionClaims):
+    """
+    Embeds the user's effective permission bitset into the access token.
+
+    `perms` is the bitset as unpadded base64url big-endian bytes, where bit N
+    is the permission with id N. `perm_version` holds the shared role and user
+    versions the bitset was built from; once either moves, the claims are
+    stale and the caller falls back to the database.
+    """
+
+    def __init__(self, *, db: AsyncSession):
+        self.db = db
+
+    async def build_claims(self, user: AuthUser) -> dict:
+        await permission_resolver.ensure_loaded(self.db)
+        mask = permission_resolver.effective_mask(user.role_ids)
+        versions = permission_resolver.versions
+        return {
+            "uid": user.id,
+            "perms": self._encode_mask(mask),
+            "perm_version": [versions[ROLES_VERSION], versions[USERS_VERSION]],
+        }
+
+    async def read_claims(self, payload: dict) -> AuthUser | None:
+        try:
+            user_id = int(payload["uid"])
+            roles_version, users_version = map(int, payload["perm_version"])
+            mask = self._decode_mask(payload["perms"])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidTokenException()
+
+        await permission_resolver.ensure_loaded(self.db)
+        versions = permission_resolver.versions
+        if (
+            roles_version < versions[ROLES_VERSION]
+            or users_version < versions[USERS_VERSION]
+        ):
+            return None
+
+        return AuthUser(id=user_id, email=payload["sub"], permission_mask=mask)
+
+    @staticmethod
+    def _encode_mask(mask: int) -> str:
+        raw = mask.to_bytes(max(1, (mask.bit_length() + 7) // 8), "big")
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    @staticmethod
+    def _decode_mask(encoded: str) -> int:
+        padding = "=" * (-len(encoded) % 4)
+        return int.from_bytes(base64.urlsafe_b64decode(encoded + padding), "big")
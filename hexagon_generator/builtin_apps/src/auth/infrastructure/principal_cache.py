@@ -0,0 +1,87 @@
+import os
+import time
+from collections import OrderedDict
+
+from src.auth.application.schemas import AuthUser
+from src.auth.domain.principal_cache import PrincipalCache
+
+
+class InMemoryPrincipalCache(PrincipalCache):
+    """
+    LRU + TTL cache of the authenticated user, keyed by access token.
+
+    An entry never outlives the token `exp` nor `ttl_seconds`.
+    """
+
+    def __init__(self, *, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[AuthUser, float]] = OrderedDict()
+        self._tokens_by_user: dict[int, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, token: str) -> AuthUser | None:
+        entry = self._entries.get(token)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        user, expires_at = entry
+        if expires_at <= time.time():
+            self._remove(token)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return user
+
+    def set(self, token: str, user: AuthUser, *, expires_at: float) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0:
+            return
+
+        self._entries[token] = (user, min(expires_at, time.time() + self.ttl_seconds))
+        self._entries.move_to_end(token)
+        self._tokens_by_user.setdefault(user.id, set()).add(token)
+
+        while len(self._entries) > self.max_size:
+            oldest_token = next(iter(self._entries))
+            self._remove(oldest_token)
+            self.evictions += 1
+
+    def invalidate_user(self, user_id: int) -> None:
+        for token in self._tokens_by_user.pop(user_id, set()):
+            self._entries.pop(token, None)
+        self.invalidations += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        user_tokens = self._tokens_by_user.get(entry[0].id)
+        if user_tokens is not None:
+            user_tokens.discard(token)
+            if not user_tokens:
+                del self._tokens_by_user[entry[0].id]
+
+
+principal_cache = InMemoryPrincipalCache(
+    max_size=int(os.getenv("AUTH_CACHE_MAX_SIZE", "10000")),
+    ttl_seconds=float(os.getenv("AUTH_CACHE_TTL_SECONDS", "60")),
+)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.application.use_cases.auth import AuthUseCase
 from src.auth.infrastructure.database import ORMAuthRepository
+from src.auth.infrastructure.permission_claims import JWTPermissionClaims
 from src.auth.application.schemas import AuthRequest
 from src.common.database_connection import get_db
 
@@ -16,7 +17,10 @@ router = APIRouter(
 
 
 def get_auth_use_case(db: AsyncSession = Depends(get_db)) -> AuthUseCase:
-    return AuthUseCase(auth_repo=ORMAuthRepository(db=db))
+    return AuthUseCase(
+        auth_repo=ORMAuthRepository(db=db),
+        permission_claims=JWTPermissionClaims(db=db),
+    )
 
 
 @router.post("/token")
@@ -0,0 +1,362 @@
+import asyncio
+import logging
+import os
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Protocol
+
+from starlette.datastructures import MutableHeaders
+from starlette.responses import JSONResponse
+
+try:
+    import brotli
+except ImportError:  # optional: pip install brotli
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/css",
+    "text/csv",
+    "text/html",
+    "text/plain",
+)
+# Bigger bodies are compressed in a worker thread (the codecs release the
+# GIL) instead of holding the event loop for several milliseconds.
+OFFLOAD_SIZE = 256 * 1024
+
+
+class StreamCompressor(Protocol):
+    def compress(self, data: bytes) -> bytes:
+        """Compress a chunk and flush it, so the client can decode it now."""
+
+    def finish(self, data: bytes) -> bytes:
+        """Compress the last chunk and end the stream."""
+
+
+@dataclass(frozen=True)
+class Codec:
+    name: str
+    level: int
+    max_level: int
+    compress: Callable[[bytes, int], bytes]
+    stream: Callable[[int], StreamCompressor]
+
+
+class _GzipStream:
+    def __init__(self, level: int):
+        # wbits=31: zlib stream with a gzip header and trailer.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _BrotliStream:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+class _ZstdStream:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def _available_codecs() -> dict[str, Codec]:
+    codecs = {
+        "gzip": Codec(
+            name="gzip",
+            level=int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+            max_level=9,
+            compress=lambda data, level: zlib.compress(data, level, wbits=31),
+            stream=_GzipStream,
+        )
+    }
+    if brotli is not None:
+        codecs["br"] = Codec(
+            name="br",
+            level=int(os.getenv("COMPRESSION_BROTLI_LEVEL", "4")),
+            max_level=11,
+            compress=lambda data, level: brotli.compress(data, quality=level),
+            stream=_BrotliStream,
+        )
+    if zstandard is not None:
+        codecs["zstd"] = Codec(
+            name="zstd",
+            level=int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3")),
+            max_level=19,
+            compress=lambda data, level: zstandard.ZstdCompressor(
+                level=level
+            ).compress(data),
+            stream=_ZstdStream,
+        )
+    return codecs
+
+
+def _configured_codecs() -> tuple[Codec, ...]:
+    available = _available_codecs()
+    selected = []
+    for name in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(","):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name in available:
+            selected.append(available[name])
+        else:
+            logger.warning(f"Compresión {name} no disponible, se omite")
+    return tuple(selected)
+
+
+@lru_cache(maxsize=256)
+def negotiate(accept_encoding: str, offered: tuple[str, ...]) -> str | None:
+    """
+    Pick the encoding with the highest q-value in `Accept-Encoding`; ties go
+    to the first one in `offered` (the server's preference order).
+    """
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for name in offered:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+class PrecompressedPayload:
+    """A body compressed once, at the maximum level, with every codec."""
+
+    def __init__(
+        self, body: bytes, *, content_type: str, codecs: tuple[Codec, ...]
+    ):
+        self.content_type = content_type
+        self.bodies = {
+            codec.name: codec.compress(body, codec.max_level) for codec in codecs
+        }
+        self.bodies["identity"] = body
+
+    async def send(self, send, encoding: str | None) -> None:
+        body = self.bodies[encoding or "identity"]
+        headers = [
+            (b"content-type", self.content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+            (b"vary", b"Accept-Encoding"),
+        ]
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with the best encoding the client accepts.
+
+    Only bodies of an allowed content type and at least `minimum_size`
+    bytes are compressed; responses that already carry a Content-Encoding
+    pass through. Streaming responses are compressed and flushed chunk by
+    chunk, so each chunk reaches the client as soon as it is produced.
+
+    The OpenAPI document is built and compressed once, in the background
+    after startup (lifespan), and served from memory once ready; until then
+    it is compressed per request like any other response.
+    """
+
+    def __init__(
+        self,
+        app,
+        *,
+        codecs: tuple[Codec, ...] | None = None,
+        minimum_size: int | None = None,
+        content_types: tuple[str, ...] | None = None,
+        precompress_openapi: bool = True,
+    ):
+        self.app = app
+        self.codecs = {
+            codec.name: codec
+            for codec in (codecs if codecs is not None else _configured_codecs())
+        }
+        self.offered = tuple(self.codecs)
+        self.minimum_size = (
+            minimum_size
+            if minimum_size is not None
+            else int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+        )
+        if content_types is None:
+            configured = os.getenv("COMPRESSION_CONTENT_TYPES", "")
+            content_types = tuple(
+                item.strip() for item in configured.split(",") if item.strip()
+            )
+        self.content_types = frozenset(content_types or DEFAULT_CONTENT_TYPES)
+        self.precompress_openapi = precompress_openapi
+        self._openapi: PrecompressedPayload | None = None
+        self._openapi_url: str | None = None
+        self._openapi_task: asyncio.Task | None = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            await self.app(scope, self._on_startup(scope, receive), send)
+            return
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = None
+        if self.offered:
+            for name, value in scope["headers"]:
+                if name == b"accept-encoding":
+                    encoding = negotiate(value.decode("latin-1"), self.offered)
+                    break
+
+        if (
+            self._openapi is not None
+            and scope["path"] == self._openapi_url
+            and scope["method"] == "GET"
+            # FastAPI adds the root_path to the document's servers per request.
+            and not scope.get("root_path")
+        ):
+            await self._openapi.send(send, encoding)
+            return
+
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, self._compressing_send(send, encoding))
+
+    def _on_startup(self, scope, receive):
+        async def wrapped():
+            message = await receive()
+            if message["type"] == "lifespan.startup" and self.precompress_openapi:
+                # Maximum-level brotli/zstd on a large schema takes a while:
+                # do not hold startup (and health checks) for it.
+                self._openapi_task = asyncio.create_task(
+                    self._build_openapi(scope["app"])
+                )
+            return message
+
+        return wrapped
+
+    async def _build_openapi(self, app) -> None:
+        if getattr(app, "openapi_url", None) is None:
+            return
+        try:
+            body = JSONResponse(app.openapi()).body
+            payload = await asyncio.to_thread(
+                PrecompressedPayload,
+                body,
+                content_type="application/json",
+                codecs=tuple(self.codecs.values()),
+            )
+        except Exception as e:
+            logger.error(f"Error precomprimiendo OpenAPI: {e}")
+            return
+        self._openapi_url = app.openapi_url
+        self._openapi = payload
+        sizes = ", ".join(
+            f"{name} {len(data)}" for name, data in self._openapi.bodies.items()
+        )
+        logger.info(f"OpenAPI precomprimido ({sizes} bytes)")
+
+    def _compressible(self, status: int, headers: MutableHeaders) -> bool:
+        if status in (204, 304) or "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";", 1)[0].strip()
+        return media_type.lower() in self.content_types
+
+    def _compressing_send(self, send, encoding: str):
+        codec = self.codecs[encoding]
+        start = None
+        compressor = None
+        passthrough = False
+
+        async def wrapped(message):
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is None:
+                headers = MutableHeaders(scope=start)
+                if not self._compressible(start["status"], headers) or (
+                    not more_body and len(body) < self.minimum_size
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body:
+                    if len(body) >= OFFLOAD_SIZE:
+                        body = await asyncio.to_thread(
+                            codec.compress, body, codec.level
+                        )
+                    else:
+                        body = codec.compress(body, codec.level)
+                    headers["Content-Length"] = str(len(body))
+                    passthrough = True
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                del headers["Content-Length"]
+                compressor = codec.stream(codec.level)
+                await send(start)
+
+            if not more_body:
+                chunk = compressor.finish(body)
+            elif body:
+                chunk = compressor.compress(body)
+            else:
+                chunk = b""
+            await send(
+                {"type": "http.response.body", "body": chunk, "more_body": more_body}
+            )
+
+        return wrapped
@@ -0,0 +1,75 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+# Clients may keep the response but must revalidate it on every use, which
+# is what turns repeated polling into cheap 304s.
+CACHE_CONTROL = "private, no-cache"
+
+
+def entity_etag(*values) -> str:
+    """
+    Weak ETag hashed from domain entities (dataclasses) instead of the JSON
+    body, so it can be compared before anything is serialized.
+    """
+    digest = hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    *,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """
+    Put the validators on `response` and return a bodyless 304 when the
+    client's copy still matches; None means the route answers as usual.
+
+    `If-None-Match` takes precedence over `If-Modified-Since` (RFC 9110).
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        last_modified = _as_utc(last_modified).replace(microsecond=0)
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    else:
+        since = _parse_http_date(request.headers.get("if-modified-since"))
+        fresh = since is not None and last_modified is not None
+        fresh = fresh and last_modified <= since
+
+    if fresh:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    # Weak comparison: W/"x" and "x" are the same validator.
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def _parse_http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return _as_utc(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -3,9 +3,12 @@ import os
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
+from src.common.observability.db import InstrumentedAsyncPool, instrument_engine
+
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_async_engine(DATABASE_URL)
+engine = create_async_engine(DATABASE_URL, poolclass=InstrumentedAsyncPool)
+instrument_engine(engine)
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -2,6 +2,9 @@ from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
+from src.common.observability.exception_handlers import (
+    EXCEPTIONS_OBSERVABILITY_MAPPING,
+)
 from src.common.std_response import std_response
 
 # TODO: Import your module exception mappings here
@@ -43,6 +46,7 @@ ALL_EXCEPTIONS = [
     (sqlalchemy_error_handler, SQLAlchemyError),
     (general_exception_handler, Exception),
 ]
+ALL_EXCEPTIONS += EXCEPTIONS_OBSERVABILITY_MAPPING
 
 # TODO: Append your module exception mappings here
 # Example:
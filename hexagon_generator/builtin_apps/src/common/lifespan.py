@@ -0,0 +1,34 @@
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable
+
+from fastapi import FastAPI
+
+# TODO: Import your module lifespan hooks here
+# Example:
+# from src.smtp.dependencies.outbox_worker import email_outbox_worker
+# from src.smtp.dependencies.smtp_pool import smtp_pool
+# from src.smtp.utils.email_templates import email_templates
+# from src.role.utils.populate import populate
+
+
+STARTUP_HOOKS: list[Callable[[], Awaitable[None]]] = []
+SHUTDOWN_HOOKS: list[Callable[[], Awaitable[None]]] = []
+
+# TODO: Append your module lifespan hooks here
+# Example:
+# STARTUP_HOOKS.append(populate)
+# STARTUP_HOOKS.append(email_outbox_worker.start)
+# STARTUP_HOOKS.append(email_templates.preload)
+# SHUTDOWN_HOOKS.append(email_outbox_worker.stop)
+# SHUTDOWN_HOOKS.append(smtp_pool.close_all)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    for hook in STARTUP_HOOKS:
+        await hook()
+    try:
+        yield
+    finally:
+        for hook in SHUTDOWN_HOOKS:
+            await hook()
@@ -1,22 +1,111 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener
 
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
-def setup_logger():
-    logging.basicConfig(
-        level=logging.DEBUG,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
 
-    logger = logging.getLogger(__name__)
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, ready for log collectors."""
 
-    file_handler = logging.FileHandler("src.log")
-    file_handler.setLevel(logging.DEBUG)
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
 
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-    )
-    file_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
+class DebugSampler(logging.Filter):
+    """Let through a fraction of DEBUG records; other levels always pass."""
 
-    return logger
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or random.random() < self.rate
+
+
+_queue_handler: QueueHandler | None = None
+_listener: QueueListener | None = None
+
+
+def configure_logging(
+    *,
+    level: str | None = None,
+    json_format: bool | None = None,
+    log_file: str | None = None,
+    debug_sample_rate: float | None = None,
+) -> None:
+    """
+    Configure the root logger once per process.
+
+    Records are put on an in-memory queue by the calling code and written
+    to stderr and `log_file` by a background listener thread, so logging
+    never blocks the event loop on I/O. Calling it again is a no-op.
+    """
+    global _queue_handler, _listener
+    if _listener is not None:
+        return
+
+    level = level or os.getenv("LOG_LEVEL", "INFO")
+    if json_format is None:
+        json_format = os.getenv("LOG_JSON", "false").lower() == "true"
+    if log_file is None:
+        log_file = os.getenv("LOG_FILE", "src.log")
+    if debug_sample_rate is None:
+        debug_sample_rate = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "1"))
+
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT)
+    handlers: list[logging.Handler] = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    # Sampled out records are dropped before they reach the queue.
+    if debug_sample_rate < 1:
+        _queue_handler.addFilter(DebugSampler(debug_sample_rate))
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Flush the pending records and stop the listener thread."""
+    global _queue_handler, _listener
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _queue_handler = None
+    _listener = None
+
+
+def setup_logger(name: str = "src") -> logging.Logger:
+    """
+    Kept for backwards compatibility.
+
+    Prefer `logging.getLogger(__name__)` in modules and a single
+    `configure_logging()` call at startup.
+    """
+    configure_logging()
+    return logging.getLogger(name)
@@ -0,0 +1,32 @@
+import os
+import secrets
+from typing import Annotated
+
+from fastapi import Header
+
+from src.common.observability.exceptions import AdminAccessDeniedException
+
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+def is_admin_token(token: str | None) -> bool:
+    """Without `ADMIN_TOKEN` configured no token is valid."""
+    if not (ADMIN_TOKEN and token):
+        return False
+    # compare_digest only accepts ASCII str; headers arrive decoded as latin-1,
+    # so compare the raw bytes instead.
+    try:
+        raw_token = token.encode("latin-1")
+    except UnicodeEncodeError:
+        return False
+    return secrets.compare_digest(raw_token, ADMIN_TOKEN.encode())
+
+
+async def require_admin(
+    x_admin_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Guard for the `/debug` endpoints: `X-Admin-Token` must match `ADMIN_TOKEN`."""
+    if not x_admin_token:
+        raise AdminAccessDeniedException("Admin token required")
+    if not is_admin_token(x_admin_token):
+        raise AdminAccessDeniedException("Invalid admin token")
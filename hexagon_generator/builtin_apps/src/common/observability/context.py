@@ -0,0 +1,24 @@
+from contextvars import ContextVar
+
+
+class RequestStats:
+    """
+    Database work done while serving one request.
+
+    `statements` counts executions per normalized SQL shape; it stays None
+    unless the query inspector is enabled.
+    """
+
+    __slots__ = ("scope", "queries", "db_seconds", "pool_wait_seconds", "statements")
+
+    def __init__(self, scope: dict | None = None):
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.statements: dict[str, int] | None = None
+
+
+current_request_stats: ContextVar[RequestStats | None] = ContextVar(
+    "current_request_stats", default=None
+)
@@ -0,0 +1,77 @@
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.common.observability.context import current_request_stats
+from src.common.observability.metrics import registry
+from src.common.observability.slow_queries import slow_query_log
+from src.common.observability.sql import normalize_sql
+
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds", "Time spent executing SQL statements"
+).labels()
+db_pool_wait = registry.histogram(
+    "db_pool_wait_seconds", "Time spent waiting for a pooled connection"
+).labels()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Default async pool that also times how long checkouts wait."""
+
+    # Log under SQLAlchemy's own pool logger, which defaults to WARN.
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = perf_counter() - start
+            db_pool_wait.observe(elapsed)
+            stats = current_request_stats.get()
+            if stats is not None:
+                stats.pool_wait_seconds += elapsed
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started_at = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - context._query_started_at
+    db_query_duration.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if stats.statements is not None:
+            shape = normalize_sql(statement)
+            stats.statements[shape] = stats.statements.get(shape, 0) + 1
+    if elapsed >= slow_query_log.threshold:
+        slow_query_log.record(
+            statement=statement,
+            parameters=parameters,
+            elapsed=elapsed,
+            executemany=executemany,
+        )
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Time every statement and expose the pool usage as gauges."""
+    slow_query_log.attach(engine)
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+    pool = engine.sync_engine.pool
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        registry.gauge_callback(
+            "db_pool_checked_out", "Connections currently in use", pool.checkedout
+        )
+        registry.gauge_callback(
+            "db_pool_size", "Connections kept open by the pool", pool.size
+        )
+        registry.gauge_callback(
+            "db_pool_overflow", "Connections opened above the pool size", pool.overflow
+        )
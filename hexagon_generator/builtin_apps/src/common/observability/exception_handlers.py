@@ -0,0 +1,59 @@
+from fastapi import Request, status
+
+from src.common.observability.exceptions import (
+    AdminAccessDeniedException,
+    MemorySnapshotNotFoundException,
+    MemoryTracingNotStartedException,
+    ProfilerBusyException,
+)
+from src.common.std_response import std_response
+
+
+async def admin_access_denied_handler(
+    request: Request, exc: AdminAccessDeniedException
+):
+    return std_response(
+        status_code=status.HTTP_403_FORBIDDEN,
+        ok=False,
+        msg=str(exc),
+        data=None,
+    )
+
+
+async def profiler_busy_handler(request: Request, exc: ProfilerBusyException):
+    return std_response(
+        status_code=status.HTTP_409_CONFLICT,
+        ok=False,
+        msg=str(exc),
+        data=None,
+    )
+
+
+async def memory_tracing_not_started_handler(
+    request: Request, exc: MemoryTracingNotStartedException
+):
+    return std_response(
+        status_code=status.HTTP_409_CONFLICT,
+        ok=False,
+        msg=str(exc),
+        data=None,
+    )
+
+
+async def memory_snapshot_not_found_handler(
+    request: Request, exc: MemorySnapshotNotFoundException
+):
+    return std_response(
+        status_code=status.HTTP_404_NOT_FOUND,
+        ok=False,
+        msg=str(exc),
+        data=None,
+    )
+
+
+EXCEPTIONS_OBSERVABILITY_MAPPING = [
+    (admin_access_denied_handler, AdminAccessDeniedException),
+    (profiler_busy_handler, ProfilerBusyException),
+    (memory_tracing_not_started_handler, MemoryTracingNotStartedException),
+    (memory_snapshot_not_found_handler, MemorySnapshotNotFoundException),
+]
@@ -0,0 +1,14 @@
+class AdminAccessDeniedException(Exception):
+    pass
+
+
+class ProfilerBusyException(Exception):
+    pass
+
+
+class MemoryTracingNotStartedException(Exception):
+    pass
+
+
+class MemorySnapshotNotFoundException(Exception):
+    pass
@@ -0,0 +1,189 @@
+import os
+import sysconfig
+import threading
+import tracemalloc
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Literal
+
+from src.common.observability.exceptions import (
+    MemorySnapshotNotFoundException,
+    MemoryTracingNotStartedException,
+)
+
+GroupBy = Literal["module", "filename", "lineno"]
+STDLIB_PATH = sysconfig.get_paths()["stdlib"]
+
+IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+@dataclass
+class AllocationStat:
+    location: str
+    size_kib: float
+    count: int
+    size_diff_kib: float | None = None
+    count_diff: int | None = None
+
+
+@dataclass
+class SnapshotInfo:
+    id: int
+    taken_at: datetime
+    traced_kib: float
+
+
+class MemoryTracker:
+    """
+    Wraps `tracemalloc`: start/stop tracing, keep the last `max_snapshots`
+    snapshots and report the top allocation sites or the growth between
+    two snapshots, by line, by file or by module (`src/user`, `sqlalchemy`).
+
+    Start tracing with more than one frame to have allocations made inside
+    libraries (ORM identity maps, Pydantic models) credited to the `src/`
+    module that triggered them.
+    """
+
+    def __init__(self, *, max_snapshots: int = 10):
+        self.max_snapshots = max_snapshots
+        self._snapshots: OrderedDict[
+            int, tuple[SnapshotInfo, tracemalloc.Snapshot]
+        ] = OrderedDict()
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def start(self, *, frames: int = 1) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+        self._snapshots.clear()
+
+    def status(self) -> dict:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": tracemalloc.is_tracing(),
+            "traced_kib": round(_kib(current), 1),
+            "peak_kib": round(_kib(peak), 1),
+            "snapshots": [info for info, _snapshot in self._snapshots.values()],
+        }
+
+    def take_snapshot(self) -> SnapshotInfo:
+        if not tracemalloc.is_tracing():
+            raise MemoryTracingNotStartedException("tracemalloc is not tracing")
+        snapshot = tracemalloc.take_snapshot().filter_traces(IGNORED_TRACES)
+        with self._lock:
+            info = SnapshotInfo(
+                id=self._next_id,
+                taken_at=datetime.now(timezone.utc),
+                traced_kib=round(_kib(tracemalloc.get_traced_memory()[0]), 1),
+            )
+            self._next_id += 1
+            self._snapshots[info.id] = (info, snapshot)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return info
+
+    def top(self, *, id: int, group_by: GroupBy, limit: int) -> list[AllocationStat]:
+        snapshot = self._get(id)
+        stats: dict[str, AllocationStat] = {}
+        for stat in snapshot.statistics(_key_type(snapshot, group_by)):
+            location = _location(stat.traceback, group_by)
+            entry = stats.setdefault(location, AllocationStat(location, 0, 0))
+            entry.size_kib += _kib(stat.size)
+            entry.count += stat.count
+        return _largest(stats.values(), limit, key=lambda entry: entry.size_kib)
+
+    def diff(
+        self, *, from_id: int, to_id: int, group_by: GroupBy, limit: int
+    ) -> list[AllocationStat]:
+        older, newer = self._get(from_id), self._get(to_id)
+        stats: dict[str, AllocationStat] = {}
+        for stat in newer.compare_to(older, _key_type(newer, group_by)):
+            location = _location(stat.traceback, group_by)
+            entry = stats.setdefault(location, AllocationStat(location, 0, 0, 0, 0))
+            entry.size_kib += _kib(stat.size)
+            entry.count += stat.count
+            entry.size_diff_kib += _kib(stat.size_diff)
+            entry.count_diff += stat.count_diff
+        return _largest(
+            stats.values(), limit, key=lambda entry: abs(entry.size_diff_kib)
+        )
+
+    def _get(self, id: int) -> tracemalloc.Snapshot:
+        try:
+            return self._snapshots[id][1]
+        except KeyError:
+            raise MemorySnapshotNotFoundException(f"Snapshot {id} not found")
+
+
+def _key_type(snapshot: tracemalloc.Snapshot, group_by: GroupBy) -> str:
+    if group_by == "module" and snapshot.traceback_limit > 1:
+        return "traceback"
+    return "lineno" if group_by == "lineno" else "filename"
+
+
+def _location(traceback: tracemalloc.Traceback, group_by: GroupBy) -> str:
+    if group_by == "module":
+        for frame in reversed(traceback):
+            filename = _short_path(frame.filename)
+            if filename.startswith("src" + os.sep):
+                return _module(filename)
+    # Frames go from the oldest to the most recent one.
+    frame = traceback[-1]
+    filename = _short_path(frame.filename)
+    if group_by == "lineno":
+        return f"{filename}:{frame.lineno}"
+    if group_by == "filename":
+        return filename
+    return _module(filename)
+
+
+def _short_path(filename: str) -> str:
+    if "site-packages" in filename:
+        return filename.split("site-packages", 1)[1].lstrip(os.sep)
+    if filename.startswith(STDLIB_PATH):
+        return os.path.join("stdlib", os.path.relpath(filename, STDLIB_PATH))
+    if filename.startswith(os.getcwd()):
+        return os.path.relpath(filename)
+    return filename
+
+
+def _module(filename: str) -> str:
+    parts = filename.split(os.sep)
+    if parts[0] == "src" and len(parts) > 2:
+        return os.sep.join(parts[:2])
+    if len(parts) > 1 and not os.path.isabs(filename):
+        return parts[0]
+    return os.path.basename(filename)
+
+
+def _largest(entries, limit: int, *, key) -> list[AllocationStat]:
+    return [
+        AllocationStat(
+            location=entry.location,
+            size_kib=round(entry.size_kib, 1),
+            count=entry.count,
+            size_diff_kib=(
+                None if entry.size_diff_kib is None else round(entry.size_diff_kib, 1)
+            ),
+            count_diff=entry.count_diff,
+        )
+        for entry in sorted(entries, key=key, reverse=True)[:limit]
+    ]
+
+
+def _kib(size: int) -> float:
+    return size / 1024
+
+
+memory_tracker = MemoryTracker(
+    max_snapshots=int(os.getenv("MEMORY_MAX_SNAPSHOTS", "10")),
+)
@@ -0,0 +1,184 @@
+from bisect import bisect_left
+from typing import Callable, Iterable
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+
+class Gauge:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram.
+
+    Buckets are allocated upfront; `observe` only bumps integers, the
+    cumulative counts Prometheus expects are computed when rendering.
+    """
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricFamily:
+    """A named metric and its children, one per combination of label values."""
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        documentation: str,
+        kind: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.kind = kind
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self.children: dict[tuple[str, ...], Counter | Gauge | Histogram] = {}
+
+    def labels(self, *values: str):
+        child = self.children.get(values)
+        if child is None:
+            child = self._new_child()
+            self.children[values] = child
+        return child
+
+    def _new_child(self):
+        if self.kind == "histogram":
+            return Histogram(self.buckets)
+        if self.kind == "counter":
+            return Counter()
+        return Gauge()
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for values, child in list(self.children.items()):
+            labels = _format_labels(self.labelnames, values)
+            if isinstance(child, Histogram):
+                yield from _render_histogram(self.name, labels, child)
+            else:
+                yield f"{self.name}{_wrap(labels)} {_format_value(child.value)}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.families: dict[str, MetricFamily] = {}
+        self.callbacks: list[tuple[str, str, Callable[[], float]]] = []
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> MetricFamily:
+        return self._register(name, documentation, "counter", labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> MetricFamily:
+        return self._register(name, documentation, "gauge", labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames=(),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> MetricFamily:
+        return self._register(name, documentation, "histogram", labelnames, buckets)
+
+    def gauge_callback(
+        self, name: str, documentation: str, callback: Callable[[], float]
+    ) -> None:
+        """Gauge whose value is read from `callback` at scrape time."""
+        self.callbacks.append((name, documentation, callback))
+
+    def render(self) -> str:
+        lines = []
+        for family in self.families.values():
+            lines.extend(family.render())
+        for name, documentation, callback in self.callbacks:
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {_format_value(callback())}")
+        lines.append("")
+        return "\n".join(lines)
+
+    def _register(self, name, documentation, kind, labelnames, buckets=LATENCY_BUCKETS):
+        family = self.families.get(name)
+        if family is None:
+            family = MetricFamily(
+                name=name,
+                documentation=documentation,
+                kind=kind,
+                labelnames=tuple(labelnames),
+                buckets=buckets,
+            )
+            self.families[name] = family
+        return family
+
+
+def _render_histogram(name: str, labels: str, histogram: Histogram) -> Iterable[str]:
+    separator = "," if labels else ""
+    cumulative = 0
+    for bound, count in zip(histogram.buckets, histogram.counts):
+        cumulative += count
+        le = _format_value(bound)
+        yield f'{name}_bucket{{{labels}{separator}le="{le}"}} {cumulative}'
+    cumulative += histogram.counts[-1]
+    yield f'{name}_bucket{{{labels}{separator}le="+Inf"}} {cumulative}'
+    yield f"{name}_sum{_wrap(labels)} {_format_value(histogram.sum)}"
+    yield f"{name}_count{_wrap(labels)} {histogram.count}"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    return ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _wrap(labels: str) -> str:
+    return f"{{{labels}}}" if labels else ""
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,68 @@
+from time import perf_counter
+
+from src.common.observability.context import RequestStats, current_request_stats
+from src.common.observability.metrics import COUNT_BUCKETS, registry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "Requests currently being served"
+).labels()
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "Request latency", ("method", "route")
+)
+http_responses = registry.counter(
+    "http_responses_total", "Responses sent", ("method", "route", "status")
+)
+http_request_db_queries = registry.histogram(
+    "http_request_db_queries",
+    "SQL statements executed per request",
+    ("method", "route"),
+    buckets=COUNT_BUCKETS,
+)
+http_request_db_duration = registry.histogram(
+    "http_request_db_seconds", "Time spent in SQL per request", ("method", "route")
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, status codes and DB usage.
+
+    Requests are labelled by route template (`/users/{id}`), never by raw
+    path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        stats = RequestStats(scope)
+        token = current_request_stats.set(stats)
+        http_requests_in_flight.inc()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = perf_counter() - start
+            http_requests_in_flight.dec()
+            current_request_stats.reset(token)
+
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            http_request_duration.labels(*labels).observe(elapsed)
+            http_responses.labels(*labels, status_code).inc()
+            http_request_db_queries.labels(*labels).observe(stats.queries)
+            http_request_db_duration.labels(*labels).observe(stats.db_seconds)
@@ -0,0 +1,74 @@
+import logging
+import os
+
+from src.common.observability.context import RequestStats, current_request_stats
+
+logger = logging.getLogger(__name__)
+
+QUERY_INSPECTOR_ENABLED = os.getenv("DB_QUERY_INSPECTOR", "false").lower() == "true"
+
+
+class QueryInspectorMiddleware:
+    """
+    Development aid: groups the statements of each request by shape.
+
+    Every response gets `X-DB-Query-Count` and `X-DB-Repeated-Queries`
+    (shapes executed at least `repeat_threshold` times, the usual N+1
+    signature); repeated shapes are also logged with their count.
+    """
+
+    def __init__(self, app, *, repeat_threshold: int | None = None):
+        self.app = app
+        self.repeat_threshold = repeat_threshold or int(
+            os.getenv("DB_QUERY_REPEAT_THRESHOLD", "3")
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats(scope)
+            token = current_request_stats.set(stats)
+        stats.statements = {}
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                repeated = self._repeated(stats)
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.queries).encode()))
+                headers.append((b"x-db-repeated-queries", str(len(repeated)).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            if token is not None:
+                current_request_stats.reset(token)
+            self._report(scope, stats)
+
+    def _repeated(self, stats: RequestStats) -> dict[str, int]:
+        return {
+            shape: count
+            for shape, count in stats.statements.items()
+            if count >= self.repeat_threshold
+        }
+
+    def _report(self, scope, stats: RequestStats) -> None:
+        repeated = self._repeated(stats)
+        if not repeated:
+            return
+        route = getattr(scope.get("route"), "path", scope["path"])
+        for shape, count in sorted(repeated.items(), key=lambda item: -item[1]):
+            logger.warning(
+                "Possible N+1 in %s %s: %sx %s (%s queries in total)",
+                scope["method"],
+                route,
+                count,
+                shape,
+                stats.queries,
+            )
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.common.observability.context import current_request_stats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SlowQuery:
+    statement: str
+    parameters: list | dict | None
+    duration_ms: float
+    request: str | None
+    captured_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    plan: str | None = None
+    plan_error: str | None = None
+
+
+class SlowQueryLog:
+    """
+    Keeps the last `buffer_size` statements slower than `threshold_ms`.
+
+    Parameters are stored redacted (only numbers, booleans and NULLs are
+    kept). On PostgreSQL, SELECTs also get an `EXPLAIN (ANALYZE, BUFFERS)`
+    plan, captured in the background on a separate connection inside a
+    rolled back transaction, one at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_ms: float,
+        buffer_size: int,
+        explain: bool,
+        explain_timeout_ms: int,
+    ):
+        self.threshold = threshold_ms / 1000
+        self.explain = explain
+        self.explain_timeout_ms = explain_timeout_ms
+        self.entries: deque[SlowQuery] = deque(maxlen=buffer_size)
+        self.engine: AsyncEngine | None = None
+        self._explaining = False
+        self._tasks: set[asyncio.Task] = set()
+
+    def attach(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+
+    def record(
+        self, *, statement: str, parameters, elapsed: float, executemany: bool
+    ) -> None:
+        if statement.startswith("EXPLAIN"):
+            return
+        stats = current_request_stats.get()
+        scope = stats.scope if stats is not None else None
+        entry = SlowQuery(
+            statement=statement,
+            parameters=None if executemany else _redact(parameters),
+            duration_ms=round(elapsed * 1000, 3),
+            request=f"{scope['method']} {scope['path']}" if scope else None,
+        )
+        self.entries.append(entry)
+        logger.warning("Slow query (%.1f ms): %s", entry.duration_ms, statement)
+
+        if self._should_explain(statement, executemany):
+            self._explaining = True
+            task = asyncio.get_running_loop().create_task(
+                self._explain(entry, statement, parameters)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def snapshot(self) -> list[dict]:
+        return [asdict(entry) for entry in reversed(self.entries)]
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def _should_explain(self, statement: str, executemany: bool) -> bool:
+        return (
+            self.explain
+            and not executemany
+            and not self._explaining
+            and self.engine is not None
+            and self.engine.dialect.name == "postgresql"
+            # ANALYZE runs the statement: never do it for writes.
+            and statement.lstrip().upper().startswith("SELECT")
+        )
+
+    async def _explain(self, entry: SlowQuery, statement: str, parameters) -> None:
+        # The task inherits the request context; keep the EXPLAIN out of it.
+        current_request_stats.set(None)
+        try:
+            async with self.engine.connect() as conn:
+                await conn.exec_driver_sql(
+                    f"SET LOCAL statement_timeout = {int(self.explain_timeout_ms)}"
+                )
+                result = await conn.exec_driver_sql(
+                    f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters
+                )
+                entry.plan = "\n".join(row[0] for row in result)
+                await conn.rollback()
+        except Exception as e:
+            entry.plan_error = str(e)
+        finally:
+            self._explaining = False
+
+
+def _redact(parameters):
+    if isinstance(parameters, dict):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact_value(value) for value in parameters]
+    return None
+
+
+def _redact_value(value):
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return f"<{type(value).__name__}>"
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500")),
+    buffer_size=int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "100")),
+    explain=os.getenv("SLOW_QUERY_EXPLAIN", "true").lower() == "true",
+    explain_timeout_ms=int(os.getenv("SLOW_QUERY_EXPLAIN_TIMEOUT_MS", "10000")),
+)
@@ -0,0 +1,23 @@
+import re
+from functools import lru_cache
+
+_PLACEHOLDER = r"(?:\$\d+|\?|%\(\w+\)s|%s)"
+_PLACEHOLDER_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})*\s*\)")
+_PLACEHOLDER_ONE = re.compile(_PLACEHOLDER)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(statement: str) -> str:
+    """
+    Reduce a statement to its shape: literals and bound parameters become
+    `?` and `IN (...)` lists collapse, so the same query issued with
+    different ids or list sizes groups together.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    shape = _PLACEHOLDER_ONE.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
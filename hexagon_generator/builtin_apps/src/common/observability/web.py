@@ -0,0 +1,117 @@
+import asyncio
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query
+from fastapi.responses import PlainTextResponse
+
+from src.common.observability.admin import require_admin
+from src.common.observability.memory import GroupBy, memory_tracker
+from src.common.observability.metrics import registry
+from src.common.observability.profiler import format_collapsed, sampling_profiler
+from src.common.observability.slow_queries import slow_query_log
+from src.common.password_hasher import password_hasher
+from src.common.std_response import std_response
+
+router = APIRouter(tags=["Observability"])
+
+debug_router = APIRouter(
+    prefix="/debug",
+    tags=["Observability"],
+    dependencies=[Depends(require_admin)],
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@debug_router.get("/slow-queries")
+async def list_slow_queries():
+    entries = slow_query_log.snapshot()
+    return std_response(data=entries, count=len(entries))
+
+
+@debug_router.delete("/slow-queries")
+async def clear_slow_queries():
+    slow_query_log.clear()
+    return std_response(msg="Slow query log cleared")
+
+
+@debug_router.get("/cache-stats")
+async def cache_stats():
+    data = {"password_hasher": password_hasher.stats()}
+    try:
+        from src.auth.infrastructure.principal_cache import principal_cache
+    except ImportError:  # the auth app is optional
+        pass
+    else:
+        data["principal_cache"] = principal_cache.stats()
+    return std_response(data=data)
+
+
+@debug_router.get("/profile")
+async def profile(
+    seconds: Annotated[float, Query(gt=0, le=60)] = 10,
+    interval_ms: Annotated[float, Query(ge=1, le=1000)] = 5,
+):
+    """Sample every thread for `seconds` and return collapsed stacks."""
+    stacks = await asyncio.to_thread(
+        sampling_profiler.sample, seconds=seconds, interval=interval_ms / 1000
+    )
+    return PlainTextResponse(format_collapsed(stacks))
+
+
+@debug_router.get("/memory")
+async def memory_status():
+    return std_response(data=memory_tracker.status())
+
+
+@debug_router.post("/memory/start")
+async def memory_start(frames: Annotated[int, Query(ge=1, le=50)] = 1):
+    memory_tracker.start(frames=frames)
+    return std_response(data=memory_tracker.status())
+
+
+@debug_router.post("/memory/stop")
+async def memory_stop():
+    memory_tracker.stop()
+    return std_response(msg="tracemalloc stopped, snapshots discarded")
+
+
+@debug_router.post("/memory/snapshots")
+async def memory_snapshot():
+    info = await asyncio.to_thread(memory_tracker.take_snapshot)
+    return std_response(data=info)
+
+
+@debug_router.get("/memory/snapshots/{id}")
+async def memory_top(
+    id: Annotated[int, Path(ge=1)],
+    group_by: GroupBy = "module",
+    limit: Annotated[int, Query(ge=1, le=200)] = 20,
+):
+    stats = await asyncio.to_thread(
+        memory_tracker.top, id=id, group_by=group_by, limit=limit
+    )
+    return std_response(data=[asdict(stat) for stat in stats], count=len(stats))
+
+
+@debug_router.get("/memory/diff")
+async def memory_diff(
+    from_id: Annotated[int, Query(ge=1)],
+    to_id: Annotated[int, Query(ge=1)],
+    group_by: GroupBy = "module",
+    limit: Annotated[int, Query(ge=1, le=200)] = 20,
+):
+    stats = await asyncio.to_thread(
+        memory_tracker.diff,
+        from_id=from_id,
+        to_id=to_id,
+        group_by=group_by,
+        limit=limit,
+    )
+    return std_response(data=[asdict(stat) for stat in stats], count=len(stats))
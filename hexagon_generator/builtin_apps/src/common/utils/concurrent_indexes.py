@@ -0,0 +1,86 @@
+"""
+Build indexes from an Alembic migration without locking writes.
+
+Not a migration itself: call it from one generated against your own head,
+so it never adds a second root to the project's history:
+
+    alembic revision -m "builtin indexes"
+
+    from src.common.utils.concurrent_indexes import (
+        BUILTIN_INDEXES,
+        create_indexes_concurrently,
+        drop_indexes_concurrently,
+    )
+
+    def upgrade() -> None:
+        create_indexes_concurrently(BUILTIN_INDEXES)
+
+    def downgrade() -> None:
+        drop_indexes_concurrently(BUILTIN_INDEXES)
+
+Only needed for tables created before their models declared the indexes;
+a migration that creates the tables already includes them. The unique index
+on "User".email fails if duplicated emails exist; clean them up first.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# (index name, table, columns, unique) of the indexes on the built-in models.
+BUILTIN_INDEXES = [
+    ("ix_User_email", "User", ["email"], True),
+    ("ix_Permission_name", "Permission", ["name"], True),
+    ("ix_Role_name", "Role", ["name"], False),
+    ("ix_UserRoleAssociation_role_id", "UserRoleAssociation", ["role_id"], False),
+    (
+        "ix_RolePermissionAssociation_permission_id",
+        "RolePermissionAssociation",
+        ["permission_id"],
+        False,
+    ),
+]
+
+
+def _existing_tables() -> set[str] | None:
+    if op.get_context().as_sql:
+        return None
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def _is_invalid(name: str) -> bool:
+    # A failed CONCURRENTLY build leaves an INVALID index behind that
+    # IF NOT EXISTS would otherwise keep forever.
+    if op.get_context().as_sql:
+        return False
+    result = op.get_bind().execute(
+        sa.text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+        ),
+        {"name": name},
+    )
+    return bool(result.scalar())
+
+
+def create_indexes_concurrently(indexes) -> None:
+    """
+    CREATE INDEX CONCURRENTLY IF NOT EXISTS each index, outside the
+    migration's transaction. Tables that do not exist yet are skipped.
+    """
+    tables = _existing_tables()
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in indexes:
+            if tables is not None and table not in tables:
+                continue
+            if _is_invalid(name):
+                op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            op.execute(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY "
+                f'IF NOT EXISTS "{name}" ON "{table}" ({column_list})'
+            )
+
+
+def drop_indexes_concurrently(indexes) -> None:
+    with op.get_context().autocommit_block():
+        for name, _table, _columns, _unique in reversed(indexes):
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"')
@@ -0,0 +1,22 @@
+from sqlalchemy.exc import IntegrityError
+
+UNIQUE_VIOLATION = "23505"
+# sqlite3 error name, used by the SQLite stand-in of the load tests.
+SQLITE_UNIQUE_VIOLATION = "SQLITE_CONSTRAINT_UNIQUE"
+
+
+def is_unique_violation(exc: IntegrityError) -> bool:
+    """
+    Tell whether an IntegrityError comes from a unique constraint/index.
+
+    The SQLSTATE is exposed on the DBAPI error or, for asyncpg, on the
+    driver exception it wraps. SQLite reports an error name instead.
+    """
+    for error in (exc.orig, getattr(exc.orig, "__cause__", None)):
+        if getattr(error, "sqlstate", None) == UNIQUE_VIOLATION:
+            return True
+        if getattr(error, "pgcode", None) == UNIQUE_VIOLATION:
+            return True
+        if getattr(error, "sqlite_errorname", None) == SQLITE_UNIQUE_VIOLATION:
+            return True
+    return False
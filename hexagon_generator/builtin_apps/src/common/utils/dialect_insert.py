@@ -0,0 +1,12 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def dialect_insert(db: AsyncSession, table):
+    """
+    INSERT construct of the session's dialect, so `on_conflict_do_nothing`
+    works on PostgreSQL and on the SQLite stand-in used by the load tests.
+    """
+    return _INSERTS[db.bind.dialect.name](table)
@@ -1,5 +1,4 @@
 import importlib
-import pkgutil
 from pathlib import Path
 
 
@@ -10,13 +9,15 @@ def models_import(base_package: str = "src"):
     imported_modules = {}
     base_path = Path(base_package.replace(".", "/"))
 
-    for package in pkgutil.walk_packages([str(base_path)], f"{base_package}."):
-        module_name = package.name
-        if module_name.endswith(".infrastructure.models"):
-            try:
-                module = importlib.import_module(module_name)
-                imported_modules[module_name] = module
-            except Exception as e:
-                print(f"Error al importar el módulo {module_name}: {e}")
+    # `infrastructure` folders are namespace packages (no __init__.py), which
+    # pkgutil.walk_packages does not descend into, so look the files up instead.
+    for models_path in sorted(base_path.rglob("infrastructure/models.py")):
+        relative = models_path.relative_to(base_path).with_suffix("")
+        module_name = ".".join([base_package, *relative.parts])
+        try:
+            module = importlib.import_module(module_name)
+            imported_modules[module_name] = module
+        except Exception as e:
+            print(f"Error al importar el módulo {module_name}: {e}")
 
     return imported_modules
@@ -0,0 +1,18 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """
+    Run `callback` once, when the session's current transaction commits.
+
+    Used to invalidate in-memory caches only after the write is durable.
+    """
+    event.listen(
+        session.sync_session,
+        "after_commit",
+        lambda _session: callback(),
+        once=True,
+    )
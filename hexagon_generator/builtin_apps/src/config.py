@@ -1,9 +1,5 @@
 from pydantic_settings import BaseSettings
 
-from src.common.loggin_config import setup_logger
-
-logger = setup_logger()
-
 
 class Settings(BaseSettings):
     database_url: str
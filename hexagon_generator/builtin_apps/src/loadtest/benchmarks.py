@@ -0,0 +1,424 @@
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import random
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Awaitable, Callable
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.database_connection import AsyncSessionLocal, Base, engine
+from src.common.loggin_config import configure_logging
+from src.common.observability.context import RequestStats, current_request_stats
+from src.common.utils.models_import import models_import
+from src.loadtest.report import percentile, write_report
+from src.loadtest.seed import seed
+from src.role.domain.entities import CreateRoleData, UpdateRoleData
+from src.role.infrastructure.database import ORMRoleRepository
+from src.role.infrastructure.models import PermissionORM, RoleORM
+from src.user.domain.entities import CreateUserData, UpdateUserData
+from src.user.infrastructure.database import ORMUserRepository
+from src.user.infrastructure.models import UserORM
+
+logger = logging.getLogger(__name__)
+
+ID_SAMPLE_SIZE = 1000
+
+
+@dataclass
+class BenchContext:
+    rows: int
+    rng: random.Random
+    ids: dict[type, list[int]] = field(default_factory=dict)
+    counts: dict[type, int] = field(default_factory=dict)
+    _sequence: itertools.count = field(default_factory=itertools.count)
+
+    def pick(self, model: type, k: int | None = None) -> int | list[int]:
+        if k is None:
+            return self.rng.choice(self.ids[model])
+        return self.rng.sample(self.ids[model], k=min(k, len(self.ids[model])))
+
+    def unique(self, prefix: str) -> str:
+        return f"{prefix}-{next(self._sequence)}-{self.rng.getrandbits(32):08x}"
+
+
+Run = Callable[..., Awaitable[object]]
+Setup = Callable[[AsyncSession, BenchContext], Awaitable[dict]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """
+    One repository call, measured in its own rolled back transaction.
+
+    `setup` runs first in the same transaction, untimed, and its result is
+    passed to `run` as keyword arguments. `max_statements` is the statement
+    budget: going over it means an extra round trip (or an N+1) crept into
+    the repository.
+    """
+
+    name: str
+    model: type
+    run: Run
+    max_statements: int
+    setup: Setup | None = None
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    rows: int
+    rounds: int
+    statements: int
+    max_statements: int
+    latency_ms: dict[str, float]
+
+
+def crud_benchmarks(
+    name: str,
+    repository_class: type,
+    model: type,
+    *,
+    create_data: Callable[[BenchContext], object],
+    update_data: Callable[[BenchContext], object],
+    search: str | None = None,
+    order_by: str = "id",
+    extra_statements: dict[str, int] | None = None,
+) -> list[Benchmark]:
+    """
+    get_by_id, get (first page, deep page, ordered, search), create, update
+    and delete for any repository following the generated CRUD interface.
+
+    `extra_statements` raises the budget of single operations, e.g.
+    `{"delete": 1}` for a repository that also writes an audit row.
+    """
+    extra = extra_statements or {}
+
+    def repository(db: AsyncSession):
+        return repository_class(db=db)
+
+    async def get_by_id(db, context):
+        return await repository(db).get_by_id(id=context.pick(model))
+
+    async def first_page(db, context):
+        return await repository(db).get(limit=20)
+
+    async def deep_page(db, context):
+        return await repository(db).get(skip=context.counts[model] // 2, limit=20)
+
+    async def ordered(db, context):
+        return await repository(db).get(order_by=f"-{order_by}", limit=20)
+
+    async def searched(db, context):
+        return await repository(db).get(search=search, limit=20)
+
+    async def create(db, context):
+        return await repository(db).create(data=create_data(context))
+
+    async def update(db, context):
+        return await repository(db).update(
+            id=context.pick(model), data=update_data(context)
+        )
+
+    async def create_row(db, context):
+        # Deleting a fresh row keeps foreign keys of seeded rows out of the way.
+        return {"id": (await repository(db).create(data=create_data(context))).id}
+
+    async def delete(db, context, id):
+        return await repository(db).delete(id=id)
+
+    benchmarks = [
+        Benchmark(f"{name}.get_by_id", model, get_by_id, 1),
+        Benchmark(f"{name}.get", model, first_page, 2),
+        Benchmark(f"{name}.get.deep_page", model, deep_page, 2),
+        Benchmark(f"{name}.get.order_by", model, ordered, 2),
+        Benchmark(f"{name}.create", model, create, 2 + extra.get("create", 0)),
+        Benchmark(f"{name}.update", model, update, 3 + extra.get("update", 0)),
+        Benchmark(
+            f"{name}.delete",
+            model,
+            delete,
+            3 + extra.get("delete", 0),
+            setup=create_row,
+        ),
+    ]
+    if search is not None:
+        benchmarks.insert(4, Benchmark(f"{name}.get.search", model, searched, 2))
+    return benchmarks
+
+
+async def user_get_with_roles(db, context):
+    return await ORMUserRepository(db=db).get(limit=20, include=["roles"])
+
+
+async def user_check_roles_exist(db, context):
+    return await ORMUserRepository(db=db).check_roles_exist(
+        roles=context.pick(RoleORM, k=5)
+    )
+
+
+async def user_link_roles(db, context):
+    return await ORMUserRepository(db=db).bulk_link_roles_to_user(
+        user_id=context.pick(UserORM), roles_ids=context.pick(RoleORM, k=3)
+    )
+
+
+async def role_get_with_permissions(db, context):
+    return await ORMRoleRepository(db=db).get(limit=20, include=["permissions"])
+
+
+async def role_check_permissions_exist(db, context):
+    return await ORMRoleRepository(db=db).check_permissions_exist(
+        permissions=context.pick(PermissionORM, k=5)
+    )
+
+
+async def role_link_permissions(db, context):
+    return await ORMRoleRepository(db=db).bulk_link_permissions_to_role(
+        role_id=context.pick(RoleORM), permission_ids=context.pick(PermissionORM, k=5)
+    )
+
+
+BENCHMARKS = [
+    *crud_benchmarks(
+        "user",
+        ORMUserRepository,
+        UserORM,
+        create_data=lambda context: CreateUserData(
+            name="Benchmark",
+            email=f"{context.unique('benchmark')}@example.com",
+            password="not-a-real-hash",
+            phone="3000000000",
+        ),
+        update_data=lambda context: UpdateUserData(name=context.unique("benchmark")),
+        search="user-12",
+        order_by="email",
+        # User writes bump the shared users permission version.
+        extra_statements={"update": 1, "delete": 1},
+    ),
+    Benchmark("user.get.include_roles", UserORM, user_get_with_roles, 3),
+    Benchmark("user.check_roles_exist", RoleORM, user_check_roles_exist, 1),
+    Benchmark("user.bulk_link_roles_to_user", UserORM, user_link_roles, 4),
+    *crud_benchmarks(
+        "role",
+        ORMRoleRepository,
+        RoleORM,
+        create_data=lambda context: CreateRoleData(name=context.unique("benchmark")),
+        update_data=lambda context: UpdateRoleData(name=context.unique("benchmark")),
+        search="role-1",
+        order_by="name",
+        # Role writes bump the shared roles permission version.
+        extra_statements={"create": 1, "delete": 1},
+    ),
+    Benchmark("role.get.include_permissions", RoleORM, role_get_with_permissions, 3),
+    Benchmark(
+        "role.check_permissions_exist", PermissionORM, role_check_permissions_exist, 1
+    ),
+    Benchmark(
+        "role.bulk_link_permissions_to_role", RoleORM, role_link_permissions, 4
+    ),
+]
+
+# TODO: Register your generated repositories here
+# Example:
+# from src.product.domain.entities import CreateProductData, UpdateProductData
+# from src.product.infrastructure.database import ORMProductRepository
+# from src.product.infrastructure.models import ProductORM
+# BENCHMARKS += crud_benchmarks(
+#     "product",
+#     ORMProductRepository,
+#     ProductORM,
+#     create_data=lambda context: CreateProductData(sku=context.unique("sku")),
+#     update_data=lambda context: UpdateProductData(sku=context.unique("sku")),
+# )
+
+
+async def measure(
+    benchmark: Benchmark, context: BenchContext, *, rounds: int, warmup: int
+) -> BenchmarkResult:
+    latencies = []
+    statements = 0
+    for round_number in range(warmup + rounds):
+        async with AsyncSessionLocal() as db:
+            # Check out the connection first so pool waits are not timed.
+            await db.connection()
+            prepared = {}
+            if benchmark.setup is not None:
+                prepared = await benchmark.setup(db, context)
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+            started = time.perf_counter()
+            try:
+                await benchmark.run(db, context, **prepared)
+            finally:
+                elapsed = time.perf_counter() - started
+                current_request_stats.reset(token)
+                await db.rollback()
+        if round_number >= warmup:
+            latencies.append(elapsed)
+            statements = max(statements, stats.queries)
+
+    latencies.sort()
+    return BenchmarkResult(
+        name=benchmark.name,
+        rows=context.rows,
+        rounds=rounds,
+        statements=statements,
+        max_statements=benchmark.max_statements,
+        latency_ms={
+            "min": _ms(latencies[0]),
+            "mean": _ms(sum(latencies) / len(latencies)),
+            "p50": _ms(percentile(latencies, 50)),
+            "p95": _ms(percentile(latencies, 95)),
+            "max": _ms(latencies[-1]),
+        },
+    )
+
+
+def find_regressions(
+    results: list[BenchmarkResult], baseline: dict | None, tolerance: float
+) -> list[str]:
+    """
+    Statement budgets are always enforced; latency and statement counts are
+    also compared against a previous run's JSON when one is given.
+    """
+    previous = {
+        (entry["name"], entry["rows"]): entry
+        for entry in (baseline or {}).get("results", [])
+    }
+    regressions = []
+    for result in results:
+        label = f"{result.name} @ {result.rows} rows"
+        if result.statements > result.max_statements:
+            regressions.append(
+                f"{label}: {result.statements} statements, "
+                f"budget {result.max_statements}"
+            )
+        before = previous.get((result.name, result.rows))
+        if before is None:
+            continue
+        if result.statements > before["statements"]:
+            regressions.append(
+                f"{label}: {result.statements} statements, "
+                f"baseline {before['statements']}"
+            )
+        limit = before["latency_ms"]["p50"] * (1 + tolerance)
+        if result.latency_ms["p50"] > limit:
+            regressions.append(
+                f"{label}: p50 {result.latency_ms['p50']}ms, "
+                f"baseline {before['latency_ms']['p50']}ms"
+            )
+    return regressions
+
+
+async def sample_ids(model: type, rng: random.Random) -> tuple[list[int], int]:
+    """Up to ID_SAMPLE_SIZE existing ids of `model` and its row count."""
+    async with AsyncSessionLocal() as db:
+        bounds = select(func.min(model.id), func.max(model.id), func.count())
+        low, high, count = (await db.execute(bounds)).one()
+        if low is None:
+            return [], 0
+        # Random probes into the id range; cheaper than ORDER BY random().
+        probes = sorted(rng.randint(low, high) for _ in range(ID_SAMPLE_SIZE))
+        ids = set()
+        for probe in probes:
+            found = await db.scalar(
+                select(model.id).where(model.id >= probe).order_by(model.id).limit(1)
+            )
+            if found is not None:
+                ids.add(found)
+        return sorted(ids), count
+
+
+async def main(args: argparse.Namespace) -> list[str]:
+    rng = random.Random(args.random_seed)
+    benchmarks = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if not args.only or any(benchmark.name.startswith(n) for n in args.only)
+    ]
+
+    if args.create_schema:
+        models_import()
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    results = []
+    for rows in sorted(args.rows):
+        started = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            await seed(db, users=rows, roles=args.roles, rng=rng)
+        logger.info(f"{rows} usuarios listos en {time.perf_counter() - started:.1f}s")
+
+        context = BenchContext(rows=rows, rng=rng)
+        models = {benchmark.model for benchmark in benchmarks}
+        for model in models | {UserORM, RoleORM, PermissionORM}:
+            context.ids[model], context.counts[model] = await sample_ids(model, rng)
+
+        for benchmark in benchmarks:
+            result = await measure(
+                benchmark, context, rounds=args.rounds, warmup=args.warmup
+            )
+            results.append(result)
+            logger.info(
+                f"{result.name} @ {rows}: {result.statements} sentencias, "
+                f"p50 {result.latency_ms['p50']}ms p95 {result.latency_ms['p95']}ms"
+            )
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+    regressions = find_regressions(results, baseline, args.tolerance)
+
+    write_report(
+        {
+            "database": engine.dialect.name,
+            "rounds": args.rounds,
+            "results": [asdict(result) for result in results],
+            "regressions": regressions,
+        },
+        args.output,
+    )
+    await engine.dispose()
+
+    for regression in regressions:
+        logger.error(f"Regresión: {regression}")
+    logger.info(f"Resultados escritos en {args.output}")
+    return regressions
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the repositories")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--roles", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--only", nargs="+", help="benchmark name prefixes, e.g. user.get role"
+    )
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="previous results to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed p50 slowdown (0.2 = 20%%)"
+    )
+    parser.add_argument("--random-seed", type=int, default=None)
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="create the tables before seeding (SQLite stand-in, no alembic)",
+    )
+    args = parser.parse_args()
+
+    configure_logging()
+    if asyncio.run(main(args)):
+        sys.exit(1)
@@ -0,0 +1,71 @@
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ScenarioStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: Counter[str] = field(default_factory=Counter)
+
+    def record(self, *, latency: float, status: str, failed: bool) -> None:
+        self.latencies.append(latency)
+        self.statuses[status] += 1
+        if failed:
+            self.errors += 1
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize(stats: ScenarioStats, elapsed: float) -> dict:
+    latencies = sorted(stats.latencies)
+    requests = len(latencies)
+    return {
+        "requests": requests,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / requests, 4) if requests else 0.0,
+        "throughput_rps": round(requests / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": _ms(percentile(latencies, 50)),
+            "p95": _ms(percentile(latencies, 95)),
+            "p99": _ms(percentile(latencies, 99)),
+            "max": _ms(latencies[-1]) if latencies else 0.0,
+            "mean": _ms(sum(latencies) / requests) if requests else 0.0,
+        },
+        "statuses": dict(stats.statuses),
+    }
+
+
+def build_report(stats: dict[str, ScenarioStats], elapsed: float, **meta) -> dict:
+    total = ScenarioStats()
+    for scenario_stats in stats.values():
+        total.latencies.extend(scenario_stats.latencies)
+        total.errors += scenario_stats.errors
+        total.statuses.update(scenario_stats.statuses)
+    return {
+        **meta,
+        "elapsed_seconds": round(elapsed, 3),
+        "total": summarize(total, elapsed),
+        "scenarios": {
+            name: summarize(scenario_stats, elapsed)
+            for name, scenario_stats in stats.items()
+        },
+    }
+
+
+def write_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+        file.write("\n")
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
@@ -0,0 +1,171 @@
+import argparse
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+
+import httpx
+
+from src.common.database_connection import AsyncSessionLocal, Base, engine
+from src.common.loggin_config import configure_logging
+from src.common.utils.models_import import models_import
+from src.loadtest.report import ScenarioStats, build_report, write_report
+from src.loadtest.scenarios import SCENARIOS, Scenario, ScenarioContext, login
+from src.loadtest.seed import seed
+
+logger = logging.getLogger(__name__)
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    scenarios: list[Scenario],
+    context: ScenarioContext,
+    *,
+    concurrency: int,
+    duration: float,
+) -> tuple[dict[str, ScenarioStats], float]:
+    """
+    Keep `concurrency` workers busy for `duration` seconds.
+
+    Each worker picks the next scenario at random by weight and issues it as
+    soon as the previous response arrives (closed model), so throughput is
+    whatever the server sustains at that concurrency.
+    """
+    stats = {scenario.name: ScenarioStats() for scenario in scenarios}
+    weights = [scenario.weight for scenario in scenarios]
+    started = time.perf_counter()
+    deadline = started + duration
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            scenario = context.rng.choices(scenarios, weights=weights)[0]
+            request_started = time.perf_counter()
+            try:
+                response = await scenario.request(client, context)
+                status, failed = str(response.status_code), response.is_error
+            except httpx.HTTPError as e:
+                status, failed = type(e).__name__, True
+            stats[scenario.name].record(
+                latency=time.perf_counter() - request_started,
+                status=status,
+                failed=failed,
+            )
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return stats, time.perf_counter() - started
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.random_seed)
+
+    if args.create_schema:
+        models_import()
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    async with AsyncSessionLocal() as db:
+        started = time.perf_counter()
+        result = await seed(db, users=args.users, roles=args.roles, rng=rng)
+        logger.info(
+            f"Datos de prueba: {len(result.user_ids)} usuarios, "
+            f"{len(result.role_ids)} roles en {time.perf_counter() - started:.1f}s"
+        )
+
+    if args.base_url:
+        transport, base_url = None, args.base_url
+    else:
+        from src.main import app
+
+        _include_builtin_routers(app)
+        transport, base_url = httpx.ASGITransport(app=app), "http://loadtest"
+
+    scenarios = [SCENARIOS[name] for name in args.scenarios]
+    if not result.role_ids:
+        skipped = [scenario.name for scenario in scenarios if scenario.needs_roles]
+        scenarios = [scenario for scenario in scenarios if not scenario.needs_roles]
+        if skipped:
+            logger.warning(f"Sin roles sembrados, se omite: {', '.join(skipped)}")
+    if not scenarios:
+        raise SystemExit("No hay escenarios que ejecutar")
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=args.timeout
+    ) as client:
+        context = ScenarioContext(seed=result, rng=rng)
+        response = await login(client, context)
+        if response.status_code != 200:
+            raise SystemExit(
+                f"No se pudo iniciar sesión como {result.admin_email}: "
+                f"{response.status_code} {response.text}"
+            )
+        context.token = response.json()["access_token"]
+
+        started_at = datetime.now(timezone.utc)
+        stats, elapsed = await run_load(
+            client,
+            scenarios,
+            context,
+            concurrency=args.concurrency,
+            duration=args.duration,
+        )
+
+    report = build_report(
+        stats,
+        elapsed,
+        target=args.base_url or "in-process",
+        database=engine.dialect.name,
+        started_at=started_at.isoformat(),
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        seed={"users": len(result.user_ids), "roles": len(result.role_ids)},
+    )
+    write_report(report, args.output)
+    await engine.dispose()
+
+    for name, summary in [("total", report["total"]), *report["scenarios"].items()]:
+        latency = summary["latency_ms"]
+        logger.info(
+            f"{name}: {summary['requests']} req, "
+            f"{summary['throughput_rps']} req/s, "
+            f"p50 {latency['p50']}ms p95 {latency['p95']}ms p99 {latency['p99']}ms, "
+            f"errores {summary['error_rate']:.2%}"
+        )
+    logger.info(f"Reporte escrito en {args.output}")
+
+
+def _include_builtin_routers(app) -> None:
+    """Mount the auth/user/role routers unless `api_router` already has them."""
+    from src.auth.infrastructure.web import router as auth_router
+    from src.role.infrastructure.web import router as role_router
+    from src.user.infrastructure.web import router as user_router
+
+    paths = {getattr(route, "path", None) for route in app.routes}
+    for router in (auth_router, user_router, role_router):
+        if not paths.intersection(route.path for route in router.routes):
+            app.include_router(router)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the built-in apps")
+    parser.add_argument(
+        "--base-url", help="running server to target (default: in-process app)"
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--roles", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--timeout", type=float, default=30, help="seconds")
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--output", default="loadtest-report.json")
+    parser.add_argument("--random-seed", type=int, default=None)
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="create the tables before seeding (SQLite stand-in, no alembic)",
+    )
+    args = parser.parse_args()
+
+    configure_logging()
+    asyncio.run(main(args))
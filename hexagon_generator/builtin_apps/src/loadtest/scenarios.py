@@ -0,0 +1,106 @@
+import itertools
+import random
+import uuid
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import httpx
+
+from src.loadtest.seed import SeedResult
+
+
+@dataclass
+class ScenarioContext:
+    seed: SeedResult
+    rng: random.Random
+    token: str = ""
+    _sequence: itertools.count = field(default_factory=itertools.count)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+    def unique_email(self) -> str:
+        suffix = f"{uuid.uuid4().hex[:12]}-{next(self._sequence)}"
+        return f"loadtest-new-{suffix}@example.com"
+
+
+Request = Callable[[httpx.AsyncClient, ScenarioContext], Awaitable[httpx.Response]]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    weight: int
+    request: Request
+    needs_roles: bool = False
+
+
+async def login(client: httpx.AsyncClient, context: ScenarioContext) -> httpx.Response:
+    return await client.post(
+        "/auth/token",
+        data={
+            "username": context.seed.admin_email,
+            "password": context.seed.password,
+        },
+    )
+
+
+async def list_users(
+    client: httpx.AsyncClient, context: ScenarioContext
+) -> httpx.Response:
+    skip = context.rng.randrange(max(len(context.seed.user_ids) - 20, 1))
+    return await client.get(
+        "/user/", params={"skip": skip, "limit": 20}, headers=context.headers
+    )
+
+
+async def search_users(
+    client: httpx.AsyncClient, context: ScenarioContext
+) -> httpx.Response:
+    term = f"user-{context.rng.randint(1, 999)}"
+    return await client.get(
+        "/user/", params={"search": term, "limit": 20}, headers=context.headers
+    )
+
+
+async def create_user(
+    client: httpx.AsyncClient, context: ScenarioContext
+) -> httpx.Response:
+    roles = [context.rng.choice(context.seed.role_ids)] if context.seed.role_ids else []
+    return await client.post(
+        "/user/",
+        json={
+            "name": "Load Test",
+            "email": context.unique_email(),
+            "phone": "3000000000",
+            "password": context.seed.password,
+            "roles": roles,
+        },
+        headers=context.headers,
+    )
+
+
+async def edit_role(
+    client: httpx.AsyncClient, context: ScenarioContext
+) -> httpx.Response:
+    role_id = context.rng.choice(context.seed.role_ids)
+    permissions = context.rng.sample(
+        context.seed.permission_ids, k=min(5, len(context.seed.permission_ids))
+    )
+    return await client.patch(
+        f"/role/{role_id}", json={"permissions": permissions}, headers=context.headers
+    )
+
+
+# Weights approximate a read-heavy workload: mostly listings, few writes.
+SCENARIOS = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(name="login", weight=1, request=login),
+        Scenario(name="list_users", weight=5, request=list_users),
+        Scenario(name="search_users", weight=3, request=search_users),
+        Scenario(name="create_user", weight=1, request=create_user),
+        Scenario(name="edit_role", weight=1, request=edit_role, needs_roles=True),
+    )
+}
@@ -0,0 +1,153 @@
+import random
+from dataclasses import dataclass
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.password_hasher import password_hasher
+from src.common.utils.dialect_insert import dialect_insert
+from src.role.infrastructure.models import (
+    PermissionORM,
+    RoleORM,
+    RolePermissionAssociation,
+)
+from src.role.utils.populate import (
+    SUPERUSER_ROLE,
+    build_permission_names,
+    seed_permissions,
+)
+from src.user.infrastructure.models import UserORM, UserRoleAssociation
+
+ADMIN_EMAIL = "loadtest-admin@example.com"
+PASSWORD = "Loadtest1!"
+USER_EMAIL = "loadtest-user-{}@example.com"
+ROLE_NAME = "loadtest-role-{}"
+BATCH_SIZE = 1000
+
+
+@dataclass
+class SeedResult:
+    admin_email: str
+    password: str
+    user_ids: list[int]
+    role_ids: list[int]
+    permission_ids: list[int]
+
+
+async def seed(
+    db: AsyncSession, *, users: int, roles: int, rng: random.Random
+) -> SeedResult:
+    """
+    Create an admin with every permission, `roles` roles and `users` users.
+
+    Idempotent: rows are keyed by name/email, so running it again only adds
+    what is missing. Every user shares one bcrypt hash to keep seeding fast.
+    """
+    await seed_permissions(db, build_permission_names())
+    permission_ids = list((await db.scalars(select(PermissionORM.id))).all())
+    password_hash = await password_hasher.hash(PASSWORD)
+
+    role_ids = await _seed_roles(db, roles, permission_ids, rng)
+    superuser_id = await db.scalar(
+        select(RoleORM.id)
+        .where(RoleORM.name == SUPERUSER_ROLE)
+        .order_by(RoleORM.id)
+        .limit(1)
+    )
+
+    admin_ids = await _seed_users(db, [ADMIN_EMAIL], password_hash)
+    await _link(db, UserRoleAssociation, [(admin_ids[0], superuser_id)])
+
+    emails = [USER_EMAIL.format(number) for number in range(1, users + 1)]
+    user_ids = await _seed_users(db, emails, password_hash)
+    if role_ids:
+        await _link(
+            db,
+            UserRoleAssociation,
+            [(user_id, rng.choice(role_ids)) for user_id in user_ids],
+        )
+
+    await db.commit()
+    return SeedResult(
+        admin_email=ADMIN_EMAIL,
+        password=PASSWORD,
+        user_ids=user_ids,
+        role_ids=role_ids,
+        permission_ids=permission_ids,
+    )
+
+
+async def _seed_roles(
+    db: AsyncSession, count: int, permission_ids: list[int], rng: random.Random
+) -> list[int]:
+    names = [ROLE_NAME.format(number) for number in range(1, count + 1)]
+    existing = set(
+        (await db.scalars(select(RoleORM.name).where(RoleORM.name.in_(names)))).all()
+    )
+    missing = [name for name in names if name not in existing]
+    if missing:
+        created = await db.execute(
+            insert(RoleORM)
+            .values([{"name": name} for name in missing])
+            .returning(RoleORM.id)
+        )
+        new_ids = list(created.scalars().all())
+        await _link(
+            db,
+            RolePermissionAssociation,
+            [
+                (role_id, permission_id)
+                for role_id in new_ids
+                for permission_id in rng.sample(
+                    permission_ids, k=min(5, len(permission_ids))
+                )
+            ],
+        )
+    return list(
+        (await db.scalars(select(RoleORM.id).where(RoleORM.name.in_(names)))).all()
+    )
+
+
+async def _seed_users(
+    db: AsyncSession, emails: list[str], password_hash: str
+) -> list[int]:
+    for start in range(0, len(emails), BATCH_SIZE):
+        await db.execute(
+            dialect_insert(db, UserORM)
+            .values(
+                [
+                    {
+                        "name": email.split("@")[0],
+                        "email": email,
+                        "password": password_hash,
+                        "phone": "3000000000",
+                        "is_active": True,
+                    }
+                    for email in emails[start : start + BATCH_SIZE]
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=[UserORM.email])
+        )
+
+    ids = []
+    for start in range(0, len(emails), BATCH_SIZE):
+        batch = emails[start : start + BATCH_SIZE]
+        ids.extend(
+            (await db.scalars(select(UserORM.id).where(UserORM.email.in_(batch)))).all()
+        )
+    return sorted(ids)
+
+
+async def _link(db: AsyncSession, association, pairs: list[tuple[int, int]]) -> None:
+    first, second = [column.name for column in association.__table__.primary_key]
+    for start in range(0, len(pairs), BATCH_SIZE):
+        await db.execute(
+            dialect_insert(db, association)
+            .values(
+                [
+                    {first: left, second: right}
+                    for left, right in pairs[start : start + BATCH_SIZE]
+                ]
+            )
+            .on_conflict_do_nothing()
+        )
@@ -1,16 +1,33 @@
 from fastapi import FastAPI
 from src.common.router import api_router
 from fastapi.middleware.cors import CORSMiddleware
+from src.common.compression import CompressionMiddleware
 from src.common.exceptions_mapping import ALL_EXCEPTIONS
+from src.common.lifespan import lifespan
+from src.common.loggin_config import configure_logging
+from src.common.observability.middleware import MetricsMiddleware
+from src.common.observability.profiler import ProfilerMiddleware
+from src.common.observability.query_inspector import (
+    QUERY_INSPECTOR_ENABLED,
+    QueryInspectorMiddleware,
+)
+from src.common.observability.web import debug_router, router as observability_router
+
+configure_logging()
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 app.include_router(api_router)
+app.include_router(observability_router)
+app.include_router(debug_router)
 
 for item in ALL_EXCEPTIONS:
     app.add_exception_handler(item[1], item[0])
 
 
+# Innermost, so CORS headers also reach the precompressed openapi.json.
+app.add_middleware(CompressionMiddleware)
+
 origins = [
     "*",
     "http://localhost.tiangolo.com",
@@ -27,3 +44,11 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+
+if QUERY_INSPECTOR_ENABLED:
+    app.add_middleware(QueryInspectorMiddleware)
+
+app.add_middleware(ProfilerMiddleware)
+
+# Added last so it wraps every other middleware and sees the full latency.
+app.add_middleware(MetricsMiddleware)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -21,6 +21,7 @@ class RoleResponse(BaseModel):
 class RoleListResponse(BaseModel):
     id: int = Field(..., gt=0)
     name: str
+    permissions: Optional[list[PermissionResponse]] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -40,4 +41,7 @@ class FilterParams(BaseModel):
     limit: int = Field(default=10, ge=1, le=100)
     order_by: Optional[str] = Field(default="id")
     search: Optional[str] = Field(default=None, max_length=100)
-    show_permissions: Optional[bool] = False
+    include: list[Literal["permissions"]] = Field(default_factory=list)
+    show_permissions: Optional[bool] = Field(
+        default=False, deprecated=True, description="Use include=permissions"
+    )
@@ -20,5 +20,12 @@ class ListUseCase:
             limit=filter_params.limit,
             order_by=filter_params.order_by,
             search=filter_params.search,
-            show_permissions=filter_params.show_permissions,
+            include=self._include(filter_params),
         )
+
+    @staticmethod
+    def _include(filter_params: FilterParams) -> set[str]:
+        include = set(filter_params.include)
+        if filter_params.show_permissions:
+            include.add("permissions")
+        return include
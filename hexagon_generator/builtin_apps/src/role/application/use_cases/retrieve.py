@@ -1,3 +1,5 @@
+from typing import Collection
+
 from src.role.domain.repository import RoleRepository
 from src.role.domain.entities import Role
 from src.role.domain.unit_of_work import UnitOfWork
@@ -13,5 +15,5 @@ class RetrieveUseCase:
         self.unit_of_work = unit_of_work
         self.role_repository = role_repository
 
-    async def execute(self, *, role_id: int) -> Role:
-        return await self.role_repository.get_by_id(id=role_id)
+    async def execute(self, *, role_id: int, include: Collection[str] = ()) -> Role:
+        return await self.role_repository.get_by_id(id=role_id, include=include)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
 
@@ -12,7 +12,7 @@ class Permission:
 class Role:
     id: int
     name: str
-    permissions: list[Permission] = field(default_factory=list)
+    permissions: Optional[list[Permission]] = None
 
 
 @dataclass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from src.role.domain.entities import (
     Role,
@@ -10,7 +11,7 @@ from src.role.domain.entities import (
 
 class RoleRepository(ABC):
     @abstractmethod
-    async def get_by_id(self, *, id: int) -> Role: ...
+    async def get_by_id(self, *, id: int, include: Collection[str] = ()) -> Role: ...
 
     @abstractmethod
     async def get(
@@ -20,7 +21,7 @@ class RoleRepository(ABC):
         limit: int = 10,
         order_by: str | None = None,
         search: str | None = None,
-        show_permissions: bool = False,
+        include: Collection[str] = (),
         **filters,
     ) -> tuple[list[Role], int]: ...
 
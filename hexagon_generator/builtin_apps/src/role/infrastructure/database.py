@@ -1,7 +1,11 @@
+from typing import Collection
+
 from sqlalchemy import select, update, delete, func, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
 
+from src.common.utils.dialect_insert import dialect_insert
+from src.common.utils.on_commit import run_after_commit
 from src.role.domain.repository import RoleRepository
 from src.role.domain.entities import (
     Role,
@@ -15,6 +19,11 @@ from src.role.infrastructure.models import (
     PermissionORM,
     RolePermissionAssociation,
 )
+from src.role.infrastructure.permission_resolver import (
+    ROLES_VERSION,
+    bump_permission_version,
+    permission_resolver,
+)
 
 
 class ORMRoleRepository(RoleRepository):
@@ -23,8 +32,8 @@ class ORMRoleRepository(RoleRepository):
 
     @staticmethod
     def _to_entity(orm_obj: RoleORM, *, with_permissions: bool = False) -> Role:
-        permissions = []
-        if with_permissions and orm_obj.permissions:
+        permissions = None
+        if with_permissions:
             permissions = [
                 Permission(id=p.id, name=p.name) for p in orm_obj.permissions
             ]
@@ -34,19 +43,37 @@ class ORMRoleRepository(RoleRepository):
             permissions=permissions,
         )
 
+    async def _invalidate_permissions(self) -> None:
+        # The bump commits with the change, so other workers reload too.
+        await bump_permission_version(self.db, ROLES_VERSION)
+        run_after_commit(self.db, permission_resolver.invalidate)
+
     @staticmethod
     def _permission_to_entity(orm_obj: PermissionORM) -> Permission:
         return Permission(id=orm_obj.id, name=orm_obj.name)
 
-    async def get_by_id(self, *, id: int) -> Role:
-        stmt = select(RoleORM).where(RoleORM.id == id)
+    @staticmethod
+    def _include_options(include: Collection[str]) -> list:
+        # selectinload issues one extra "WHERE id IN (...)" query per page
+        # instead of multiplying the paged rows with a JOIN.
+        options = []
+        if "permissions" in include:
+            options.append(selectinload(RoleORM.permissions))
+        return options
+
+    async def get_by_id(self, *, id: int, include: Collection[str] = ()) -> Role:
+        stmt = (
+            select(RoleORM)
+            .where(RoleORM.id == id)
+            .options(*self._include_options(include))
+        )
         result = await self.db.execute(stmt)
         orm_obj = result.scalar_one_or_none()
 
         if not orm_obj:
             raise RoleNotFoundException(f"Role with ID {id} not found")
 
-        return self._to_entity(orm_obj)
+        return self._to_entity(orm_obj, with_permissions="permissions" in include)
 
     async def get(
         self,
@@ -55,7 +82,7 @@ class ORMRoleRepository(RoleRepository):
         limit: int = 10,
         order_by: str | None = None,
         search: str | None = None,
-        show_permissions: bool = False,
+        include: Collection[str] = (),
         **filters,
     ) -> tuple[list[Role], int]:
         stmt = select(RoleORM)
@@ -64,9 +91,6 @@ class ORMRoleRepository(RoleRepository):
             search_pattern = f"%{search}%"
             stmt = stmt.where(RoleORM.name.ilike(search_pattern))
 
-        if show_permissions:
-            stmt = stmt.options(joinedload(RoleORM.permissions))
-
         count_stmt = select(func.count()).select_from(
             select(RoleORM.id).where(stmt.whereclause) if stmt.whereclause is not None
             else select(RoleORM.id)
@@ -85,13 +109,13 @@ class ORMRoleRepository(RoleRepository):
         else:
             stmt = stmt.order_by(desc(RoleORM.id))
 
-        stmt = stmt.offset(skip).limit(limit)
+        stmt = stmt.offset(skip).limit(limit).options(*self._include_options(include))
 
         result = await self.db.execute(stmt)
-        orm_objects = result.unique().scalars().all()
+        orm_objects = result.scalars().all()
 
         return [
-            self._to_entity(obj, with_permissions=show_permissions)
+            self._to_entity(obj, with_permissions="permissions" in include)
             for obj in orm_objects
         ], count
 
@@ -101,6 +125,7 @@ class ORMRoleRepository(RoleRepository):
         self.db.add(orm_obj)
         await self.db.flush()
         await self.db.refresh(orm_obj)
+        await self._invalidate_permissions()
 
         return self._to_entity(orm_obj)
 
@@ -130,6 +155,7 @@ class ORMRoleRepository(RoleRepository):
         )
         await self.db.execute(delete(RoleORM).where(RoleORM.id == id))
         await self.db.flush()
+        await self._invalidate_permissions()
 
         return entity
 
@@ -158,13 +184,35 @@ class ORMRoleRepository(RoleRepository):
     async def bulk_link_permissions_to_role(
         self, *, role_id: int, permission_ids: list[int]
     ) -> None:
-        await self.db.execute(
-            delete(RolePermissionAssociation).where(
+        result = await self.db.execute(
+            select(RolePermissionAssociation.permission_id).where(
                 RolePermissionAssociation.role_id == role_id
             )
         )
-        await self.db.flush()
-        for permission_id in permission_ids:
-            self.db.add(
-                RolePermissionAssociation(role_id=role_id, permission_id=permission_id)
+        current = set(result.scalars().all())
+        desired = set(permission_ids)
+        to_remove = current - desired
+        to_add = desired - current
+        if not to_remove and not to_add:
+            return
+
+        if to_remove:
+            await self.db.execute(
+                delete(RolePermissionAssociation).where(
+                    RolePermissionAssociation.role_id == role_id,
+                    RolePermissionAssociation.permission_id.in_(to_remove),
+                )
+            )
+        if to_add:
+            # Sorted so concurrent edits take row locks in the same order.
+            await self.db.execute(
+                dialect_insert(self.db, RolePermissionAssociation)
+                .values(
+                    [
+                        {"role_id": role_id, "permission_id": permission_id}
+                        for permission_id in sorted(to_add)
+                    ]
+                )
+                .on_conflict_do_nothing()
             )
+        await self._invalidate_permissions()
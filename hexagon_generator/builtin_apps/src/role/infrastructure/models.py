@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, ForeignKey, Text
+from sqlalchemy import BigInteger, Integer, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.common.database_connection import Base
@@ -11,7 +11,7 @@ class RolePermissionAssociation(Base):
         Integer, ForeignKey("Role.id"), primary_key=True
     )
     permission_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("Permission.id"), primary_key=True
+        Integer, ForeignKey("Permission.id"), primary_key=True, index=True
     )
 
 
@@ -19,7 +19,7 @@ class RoleORM(Base):
     __tablename__ = "Role"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(Text, nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False, index=True)
 
     permissions = relationship(
         "PermissionORM",
@@ -42,7 +42,7 @@ class PermissionORM(Base):
     __tablename__ = "Permission"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(Text, nullable=False)
+    name: Mapped[str] = mapped_column(Text, nullable=False, unique=True, index=True)
 
     roles = relationship(
         "RoleORM",
@@ -52,3 +52,18 @@ class PermissionORM(Base):
 
     def __repr__(self) -> str:
         return f"<PermissionORM(id={self.id}, name={self.name})>"
+
+
+class PermissionVersionORM(Base):
+    """
+    Shared counters bumped in the same transaction as permission changes, so
+    every worker can tell that its in-memory permission view is stale.
+    """
+
+    __tablename__ = "PermissionVersion"
+
+    name: Mapped[str] = mapped_column(Text, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<PermissionVersionORM(name={self.name}, version={self.version})>"
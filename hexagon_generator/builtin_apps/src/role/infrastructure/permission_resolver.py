@@ -0,0 +1,140 @@
+import asyncio
+import os
+import time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.utils.dialect_insert import dialect_insert
+from src.role.infrastructure.models import (
+    PermissionORM,
+    PermissionVersionORM,
+    RolePermissionAssociation,
+)
+
+# Counter bumped whenever the role -> permission mapping changes.
+ROLES_VERSION = "roles"
+# Counter bumped whenever a user's roles or status change.
+USERS_VERSION = "users"
+
+
+async def bump_permission_version(db: AsyncSession, name: str) -> None:
+    """Increment the shared counter `name` in the caller's transaction."""
+    await db.execute(
+        dialect_insert(db, PermissionVersionORM)
+        .values(name=name, version=1)
+        .on_conflict_do_update(
+            index_elements=[PermissionVersionORM.name],
+            set_={"version": PermissionVersionORM.version + 1},
+        )
+    )
+
+
+async def get_permission_versions(db: AsyncSession) -> dict[str, int]:
+    rows = await db.execute(
+        select(PermissionVersionORM.name, PermissionVersionORM.version)
+    )
+    versions = {ROLES_VERSION: 0, USERS_VERSION: 0}
+    versions.update({name: version for name, version in rows})
+    return versions
+
+
+class PermissionResolver:
+    """
+    In-memory view of the role -> permission mapping.
+
+    Permission names are interned to their database ids, and every role is
+    stored as an integer bitset where bit N is set when the role grants the
+    permission with id N. Effective permissions are memoized per set of roles,
+    so users sharing the same roles share the same bitset.
+
+    The view is rebuilt when the shared `roles` version in the database moves.
+    The versions are read at most once every `ttl_seconds`, which bounds how
+    long other workers keep a revoked permission; 0 checks on every call.
+    """
+
+    def __init__(self, *, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._permission_ids: dict[str, int] = {}
+        self._role_masks: dict[int, int] = {}
+        self._effective_masks: dict[frozenset[int], int] = {}
+        self._versions: dict[str, int] = {}
+        self._checked_at = float("-inf")
+        self._invalidations = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def versions(self) -> dict[str, int]:
+        """Shared versions as of the last check, see `ensure_loaded`."""
+        return self._versions
+
+    def _fresh(self) -> bool:
+        return time.monotonic() - self._checked_at < self.ttl_seconds
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        if self._fresh():
+            return
+
+        async with self._lock:
+            if self._fresh():
+                return
+
+            checked_at, invalidations = time.monotonic(), self._invalidations
+            versions = await get_permission_versions(db)
+            if versions[ROLES_VERSION] != self._versions.get(ROLES_VERSION):
+                await self._load(db)
+            self._versions = versions
+            if invalidations == self._invalidations:
+                self._checked_at = checked_at
+
+    async def _load(self, db: AsyncSession) -> None:
+        permissions = await db.execute(select(PermissionORM.id, PermissionORM.name))
+        permission_ids = {name: id_ for id_, name in permissions}
+
+        links = await db.execute(
+            select(
+                RolePermissionAssociation.role_id,
+                RolePermissionAssociation.permission_id,
+            )
+        )
+        role_masks: dict[int, int] = {}
+        for role_id, permission_id in links:
+            role_masks[role_id] = role_masks.get(role_id, 0) | (1 << permission_id)
+
+        self._permission_ids = permission_ids
+        self._role_masks = role_masks
+        self._effective_masks = {}
+
+    def invalidate(self) -> None:
+        # This worker committed the change: check the version on next use.
+        self._invalidations += 1
+        self._checked_at = float("-inf")
+
+    def permission_id(self, name: str) -> int | None:
+        return self._permission_ids.get(name)
+
+    def effective_mask(self, role_ids: list[int]) -> int:
+        key = frozenset(role_ids)
+        mask = self._effective_masks.get(key)
+        if mask is None:
+            mask = 0
+            for role_id in key:
+                mask |= self._role_masks.get(role_id, 0)
+            self._effective_masks[key] = mask
+        return mask
+
+    def has_permission(self, *, role_ids: list[int], permission: str) -> bool:
+        return self.mask_has_permission(
+            mask=self.effective_mask(role_ids), permission=permission
+        )
+
+    def mask_has_permission(self, *, mask: int, permission: str) -> bool:
+        permission_id = self._permission_ids.get(permission)
+        if permission_id is None:
+            return False
+        return bool(mask >> permission_id & 1)
+
+
+permission_resolver = PermissionResolver(
+    ttl_seconds=float(os.getenv("PERMISSIONS_CACHE_TTL_SECONDS", "5")),
+)
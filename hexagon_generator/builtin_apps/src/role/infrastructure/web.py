@@ -1,9 +1,10 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies.get_user_with_permissions import get_user_with_permission
+from src.common.conditional_get import entity_etag, not_modified
 from src.common.database_connection import get_db
 from src.common.std_response import StandardResponse, std_response
 from src.role.domain.entities import CreateRoleData, UpdateRoleData
@@ -47,6 +48,7 @@ def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> SQLAlchemyUnitOfWork
 Repository = Annotated[ORMRoleRepository, Depends(get_repository)]
 UoW = Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)]
 RoleId = Annotated[int, Path(..., description="ID of the Role", gt=0)]
+RoleInclude = Annotated[list[Literal["permissions"]], Query()]
 
 
 @router.post(
@@ -109,10 +111,15 @@ async def get_role(
     role_id: RoleId,
     repository: Repository,
     unit_of_work: UoW,
+    request: Request,
+    response: Response,
+    include: RoleInclude = [],
     _=Depends(get_user_with_permission("role.get")),
 ):
     use_case = RetrieveUseCase(unit_of_work=unit_of_work, role_repository=repository)
-    result = await use_case.execute(role_id=role_id)
+    result = await use_case.execute(role_id=role_id, include=include)
+    if cached := not_modified(request, response, etag=entity_etag(result)):
+        return cached
     return std_response(data=result)
 
 
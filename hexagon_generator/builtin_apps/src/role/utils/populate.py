@@ -1,64 +1,110 @@
-import os
+import asyncio
+import logging
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.common.database_connection import Base
-from src.common.loggin_config import setup_logger
+from src.common.database_connection import AsyncSessionLocal, Base
+from src.common.loggin_config import configure_logging
 from src.common.utils.models_import import models_import
+from src.common.utils.dialect_insert import dialect_insert
+from src.common.utils.on_commit import run_after_commit
 from src.role.infrastructure.models import PermissionORM, RoleORM, RolePermissionAssociation
+from src.role.infrastructure.permission_resolver import (
+    ROLES_VERSION,
+    bump_permission_version,
+    permission_resolver,
+)
 
-logger = setup_logger()
-models_import()
+logger = logging.getLogger(__name__)
 
-# Populate uses a sync engine since it runs as a standalone script
-DATABASE_URL = os.getenv("DATABASE_URL")
-sync_url = DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://")
-sync_engine = create_engine(sync_url)
-SyncSession = sessionmaker(bind=sync_engine)
-
-black_listed_tables = ["PermissionORM", "RolePermissionAssociation", "UserRoleAssociation"]
-actions = ["create", "update", "delete", "get", "list"]
-tables = [mapper.class_.__name__ for mapper in Base.registry.mappers]
-permissions_list = [
-    f"{table.lower().replace('orm', '')}.{action}"
-    for table in tables
-    for action in actions
-    if table not in black_listed_tables
+black_listed_tables = [
+    "PermissionORM",
+    "RolePermissionAssociation",
+    "UserRoleAssociation",
+    "EmailOutboxORM",
+    "PermissionVersionORM",
 ]
+actions = ["create", "update", "delete", "get", "list"]
+SUPERUSER_ROLE = "superuser"
+# Key of the PostgreSQL advisory lock that serializes concurrent seeding.
+SEED_LOCK_KEY = 0x5EED_0001
+
+
+def build_permission_names() -> list[str]:
+    models_import()
+    tables = sorted(mapper.class_.__name__ for mapper in Base.registry.mappers)
+    return [
+        f"{table.lower().replace('orm', '')}.{action}"
+        for table in tables
+        for action in actions
+        if table not in black_listed_tables
+    ]
 
-session = SyncSession()
 
-permissions = []
-for permission_name in permissions_list:
-    existing_permission = (
-        session.query(PermissionORM).filter_by(name=permission_name).first()
+async def seed_permissions(db: AsyncSession, permission_names: list[str]) -> None:
+    """
+    Create the missing permissions and grant all of them to the superuser.
+
+    Set-based: one INSERT for the permissions and one INSERT ... SELECT for
+    the associations, both skipping rows that already exist.
+
+    When it runs on every worker's startup, the workers seed concurrently;
+    on PostgreSQL a transaction-level advisory lock makes them take turns,
+    so the superuser role (whose name is not unique) is created only once.
+    """
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(select(func.pg_advisory_xact_lock(SEED_LOCK_KEY)))
+
+    inserted_permissions = await db.execute(
+        dialect_insert(db, PermissionORM)
+        .values([{"name": name} for name in permission_names])
+        .on_conflict_do_nothing(index_elements=[PermissionORM.name])
+        .returning(PermissionORM.id)
     )
-    if not existing_permission:
-        permission = PermissionORM(name=permission_name)
-        session.add(permission)
-        session.flush()
-        permissions.append(permission)
-    else:
-        permissions.append(existing_permission)
-
-superuser_role = session.query(RoleORM).filter_by(name="superuser").first()
-if not superuser_role:
-    superuser_role = RoleORM(name="superuser")
-    session.add(superuser_role)
-    session.flush()
-
-for permission in permissions:
-    existing_association = (
-        session.query(RolePermissionAssociation)
-        .filter_by(role_id=superuser_role.id, permission_id=permission.id)
-        .first()
+    new_permissions = len(inserted_permissions.all())
+
+    role_id = await db.scalar(
+        select(RoleORM.id)
+        .where(RoleORM.name == SUPERUSER_ROLE)
+        .order_by(RoleORM.id)
+        .limit(1)
     )
-    if not existing_association:
-        association = RolePermissionAssociation(
-            role_id=superuser_role.id, permission_id=permission.id
+    if role_id is None:
+        role_id = await db.scalar(
+            insert(RoleORM).values(name=SUPERUSER_ROLE).returning(RoleORM.id)
         )
-        session.add(association)
 
-session.commit()
-session.close()
+    inserted_links = await db.execute(
+        dialect_insert(db, RolePermissionAssociation)
+        .from_select(
+            ["role_id", "permission_id"],
+            select(literal(role_id), PermissionORM.id).where(
+                PermissionORM.name.in_(permission_names)
+            ),
+        )
+        .on_conflict_do_nothing()
+        .returning(RolePermissionAssociation.permission_id)
+    )
+    new_links = len(inserted_links.all())
+
+    if new_permissions or new_links:
+        await bump_permission_version(db, ROLES_VERSION)
+        run_after_commit(db, permission_resolver.invalidate)
+
+    logger.info(
+        f"Permisos: {new_permissions} creados, "
+        f"{new_links} asignados al rol {SUPERUSER_ROLE}"
+    )
+
+
+async def populate() -> None:
+    permission_names = build_permission_names()
+    async with AsyncSessionLocal() as session:
+        await seed_permissions(session, permission_names)
+        await session.commit()
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(populate())
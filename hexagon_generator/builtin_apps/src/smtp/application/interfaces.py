@@ -18,5 +18,8 @@ class SMTPProviderInterface(ABC):
         self, *, recipient: str, sender: str, subject: str, message: str
     ) -> None: ...
 
+    @abstractmethod
+    async def close(self) -> None: ...
+
     @abstractmethod
     async def get_smtp_credentials(self) -> SMTPBase: ...
@@ -6,6 +6,8 @@ from src.common.base_schemas import BaseModelWithNoneCheck
 
 
 class SMTPInDBBase(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     server: str
     port: str
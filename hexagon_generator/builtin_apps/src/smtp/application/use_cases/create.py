@@ -1,27 +1,25 @@
 from src.smtp.domain.repository import SMTPRepository
-from src.smtp.domain.exceptions import SMTPNotFoundException
 from src.smtp.domain.models import SMTP
+from src.smtp.domain.unit_of_work import UnitOfWork
 from src.smtp.application.interfaces import SMTPServiceInterface
 
 from src.smtp.application.schemas import CreateSMTPRequest
 
-from sqlalchemy.orm import Session
-
 
 class CreateUseCase:
     def __init__(
         self,
         *,
-        database: Session,
+        unit_of_work: UnitOfWork,
         smtp_repository: SMTPRepository,
         smtp_service: SMTPServiceInterface
     ):
-        self.database = database
+        self.unit_of_work = unit_of_work
         self.smtp_repository = smtp_repository
         self.smtp_service = smtp_service
 
-    async def execute(self, *, smtp_request: CreateSMTPRequest) -> None:
+    async def execute(self, *, smtp_request: CreateSMTPRequest) -> SMTP:
         # TODO: your logic here
-        await self.smtp_repository.create(data=smtp_request)
-        self.database.commit()
-        return
+        smtp = await self.smtp_repository.create(data=smtp_request)
+        await self.unit_of_work.commit()
+        return smtp
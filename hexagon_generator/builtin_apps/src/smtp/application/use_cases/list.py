@@ -1,10 +1,8 @@
 from src.smtp.domain.repository import SMTPRepository
-from src.smtp.domain.exceptions import SMTPNotFoundException
 from src.smtp.domain.models import SMTP
+from src.smtp.domain.unit_of_work import UnitOfWork
 from src.smtp.application.interfaces import SMTPServiceInterface
 
-from sqlalchemy.orm import Session
-
 from src.smtp.application.schemas import FilterParams
 
 
@@ -12,11 +10,11 @@ class ListUseCase:
     def __init__(
         self,
         *,
-        database: Session,
+        unit_of_work: UnitOfWork,
         smtp_repository: SMTPRepository,
         smtp_service: SMTPServiceInterface
     ):
-        self.database = database
+        self.unit_of_work = unit_of_work
         self.smtp_repository = smtp_repository
         self.smtp_service = smtp_service
 
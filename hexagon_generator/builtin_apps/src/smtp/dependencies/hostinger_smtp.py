@@ -1,24 +1,31 @@
+import asyncio
+import logging
 import smtplib
-import socket
-import ssl
 from email.mime.text import MIMEText
 
-from src.common.loggin_config import setup_logger
 from src.smtp.application.interfaces import SMTPProviderInterface
 from src.smtp.application.schemas import SMTPBase
+from src.smtp.dependencies.smtp_pool import PooledConnection, smtp_pool
 from src.smtp.domain.exceptions import ErrorSendingEmailException
 from src.smtp.domain.repository import SMTPRepository
 from src.smtp.utils.smtp_config_base import SMTPConfigBase
 
-logger = setup_logger()
+logger = logging.getLogger(__name__)
 
 
 class SMTPHostinger(SMTPProviderInterface, SMTPConfigBase):
+    """
+    SMTP provider backed by the shared connection pool.
+
+    `auth` leases an authenticated session, `send` reconnects once if the
+    server dropped it, and `close` hands the session back to the pool.
+    """
+
     def __init__(self, *, smtp_repository: SMTPRepository):
         super().__init__(smtp_repository=smtp_repository)
 
         self.smtp_credentials: SMTPBase = None
-        self.conn = None
+        self.conn: PooledConnection | None = None
 
     @classmethod
     async def create(cls, smtp_repository: SMTPRepository):
@@ -27,28 +34,14 @@ class SMTPHostinger(SMTPProviderInterface, SMTPConfigBase):
         return instance
 
     async def auth(self):
-        context = ssl.create_default_context()
-        try:
-            self.conn = smtplib.SMTP_SSL(
-                self.smtp_credentials.host, self.smtp_credentials.port, context=context
-            )
-        except socket.gaierror as e:
-            logger.error(e)
-            raise ErrorSendingEmailException(f"Error enviando mensaje, error SMTP")
-        except smtplib.SMTPException as e:
-            logger.error(e)
-            raise ErrorSendingEmailException(f"Error enviando mensaje, error SMTP")
-
-        self.conn.set_debuglevel(self.smtp_credentials.debug)
-
         try:
-            self.conn.login(self.smtp_credentials.user, self.smtp_credentials.password)
+            self.conn = await smtp_pool.acquire(self.smtp_credentials)
         except smtplib.SMTPAuthenticationError as e:
             logger.info(e)
             raise ErrorSendingEmailException(f"Error sending email")
-        except Exception as e:
-            logger.info(e)
-            raise ErrorSendingEmailException(f"Error sending email")
+        except (OSError, smtplib.SMTPException, asyncio.TimeoutError) as e:
+            logger.error(e)
+            raise ErrorSendingEmailException(f"Error enviando mensaje, error SMTP")
 
     async def send(
         self, *, recipient: str | list[str], sender: str, subject: str, message: str
@@ -60,15 +53,28 @@ class SMTPHostinger(SMTPProviderInterface, SMTPConfigBase):
 
         if self.conn:
             try:
-                self.conn.sendmail(sender, recipient, raw.as_string())
-                logger.info(f"Enviando mensaje {sender}, {recipient}")
+                self.conn = await smtp_pool.sendmail(
+                    self.conn,
+                    credentials=self.smtp_credentials,
+                    sender=sender,
+                    recipients=recipient,
+                    message=raw.as_string(),
+                )
+                logger.debug("Enviando mensaje %s, %s", sender, recipient)
             except Exception as e:
                 logger.error(f"Error enviando el mensaje {e}")
+                await self.close(discard=True)
                 raise ErrorSendingEmailException(f"Error sending email")
             return True
         else:
             logger.error(f"Error enviando el mensaje, no se estableció la conexión")
             raise ErrorSendingEmailException(f"Error sending email")
 
+    async def close(self, *, discard: bool = False) -> None:
+        if not self.conn:
+            return
+        conn, self.conn = self.conn, None
+        await smtp_pool.release(conn, discard=discard)
+
     async def get_smtp_credentials(self) -> SMTPBase:
         return self.smtp_credentials
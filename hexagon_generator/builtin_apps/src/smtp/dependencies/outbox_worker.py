@@ -0,0 +1,280 @@
+import argparse
+import asyncio
+import logging
+import os
+import time
+
+from src.common.database_connection import AsyncSessionLocal
+from src.common.loggin_config import configure_logging
+from src.smtp.dependencies.hostinger_smtp import SMTPHostinger
+from src.smtp.dependencies.smtp_pool import smtp_pool
+from src.smtp.domain.entities import OutboxEmail
+from src.smtp.domain.exceptions import (
+    EmailTemplateNotFoundException,
+    ErrorSendingEmailException,
+)
+from src.smtp.infrastructure.database import (
+    ORMEmailOutboxRepository,
+    ORMSMTPRepository,
+)
+from src.smtp.utils.email_templates import email_templates
+
+logger = logging.getLogger(__name__)
+
+# Worst case for one email: NOOP check, connect, send, reconnect and resend,
+# each bounded by the SMTP timeout.
+SMTP_CALLS_PER_EMAIL = 5
+
+
+class _BatchLease:
+    """
+    Keeps the lease of a claimed batch alive while it is being sent.
+
+    The lease is renewed (and committed) once half of it has elapsed. Emails
+    whose lease could not be renewed were claimed by another worker and must
+    be neither sent nor marked by this one.
+    """
+
+    def __init__(self, *, session, outbox, emails, lease_seconds: float):
+        self.session = session
+        self.outbox = outbox
+        self.emails = emails
+        self.lease_seconds = lease_seconds
+        self.lost: set[int] = set()
+        self._renewed_at = time.monotonic()
+
+    async def keep_alive(self) -> None:
+        if time.monotonic() - self._renewed_at < self.lease_seconds / 2:
+            return
+        renewed_at = time.monotonic()
+        held = [email for email in self.emails if email.id not in self.lost]
+        renewed = await self.outbox.renew_lease(
+            emails=held, lease_seconds=self.lease_seconds
+        )
+        await self.session.commit()
+        self._renewed_at = renewed_at
+        self.lost.update(email.id for email in held if email.id not in renewed)
+
+    def holds(self, email: OutboxEmail) -> bool:
+        return email.id not in self.lost
+
+
+class EmailOutboxWorker:
+    """
+    Delivers the emails queued in the outbox table.
+
+    Each cycle claims a batch with `FOR UPDATE SKIP LOCKED`, so several
+    workers can run side by side, sends it over one pooled SMTP session and
+    records the outcome. Failed sends are retried with exponential backoff
+    until `max_attempts` is reached, then the row is marked as failed.
+
+    Claimed rows are leased for `lease_seconds`, and the lease is renewed
+    while the batch is sent, so a slow batch is not claimed twice. The lease
+    must comfortably exceed the time one email can take (`send_timeout`).
+    """
+
+    def __init__(
+        self,
+        *,
+        session_factory=AsyncSessionLocal,
+        batch_size: int = 50,
+        poll_interval: float = 5,
+        max_attempts: int = 5,
+        backoff_base: float = 30,
+        backoff_max: float = 3600,
+        lease_seconds: float = 300,
+        send_timeout: float = 10,
+    ):
+        if lease_seconds / 2 <= SMTP_CALLS_PER_EMAIL * send_timeout:
+            raise ValueError(
+                f"EMAIL_OUTBOX_LEASE_SECONDS ({lease_seconds}) must be greater "
+                f"than {2 * SMTP_CALLS_PER_EMAIL} x SMTP_TIMEOUT_SECONDS "
+                f"({send_timeout})"
+            )
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.lease_seconds = lease_seconds
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+
+    async def run_once(self) -> int:
+        async with self.session_factory() as session:
+            outbox = ORMEmailOutboxRepository(db=session)
+            emails = await outbox.claim_batch(
+                limit=self.batch_size, lease_seconds=self.lease_seconds
+            )
+            await session.commit()
+            if not emails:
+                return 0
+
+            lease = _BatchLease(
+                session=session,
+                outbox=outbox,
+                emails=emails,
+                lease_seconds=self.lease_seconds,
+            )
+            errors = self._render(emails)
+            errors.update(
+                await self._deliver(
+                    session,
+                    [email for email in emails if email.id not in errors],
+                    lease,
+                )
+            )
+
+            emails = [email for email in emails if lease.holds(email)]
+            errors = {
+                id: error for id, error in errors.items() if id not in lease.lost
+            }
+            await outbox.mark_sent(
+                ids=[email.id for email in emails if email.id not in errors]
+            )
+            for email in emails:
+                if email.id not in errors:
+                    continue
+                await outbox.mark_failed(
+                    id=email.id,
+                    error=errors[email.id],
+                    retry_in=self._retry_in(email.attempts),
+                )
+            await session.commit()
+
+        if lease.lost:
+            logger.warning(
+                f"Bandeja de salida: {len(lease.lost)} correos reclamados por "
+                f"otro worker tras vencer su lease"
+            )
+        logger.info(
+            f"Bandeja de salida: {len(emails) - len(errors)} enviados, "
+            f"{len(errors)} con error"
+        )
+        return len(emails) + len(lease.lost)
+
+    def _render(self, emails: list[OutboxEmail]) -> dict[int, str]:
+        groups: dict[tuple[str, str | None], list[OutboxEmail]] = {}
+        for email in emails:
+            if email.template:
+                groups.setdefault((email.template, email.locale), []).append(email)
+
+        errors = {}
+        for (template, locale), group in groups.items():
+            try:
+                rendered = email_templates.render_many(
+                    template,
+                    [email.context or {} for email in group],
+                    locale=locale,
+                )
+            except EmailTemplateNotFoundException as e:
+                errors.update({email.id: str(e) for email in group})
+                continue
+            for email, result in zip(group, rendered):
+                email.subject = result.subject
+                email.body = result.body
+        return errors
+
+    async def _deliver(
+        self, session, emails: list[OutboxEmail], lease: _BatchLease
+    ) -> dict[int, str]:
+        if not emails:
+            return {}
+        provider = await SMTPHostinger.create(
+            smtp_repository=ORMSMTPRepository(db=session)
+        )
+        credentials = await provider.get_smtp_credentials()
+        if not credentials:
+            return {email.id: "Configuración SMTP no encontrada" for email in emails}
+
+        errors = {}
+        try:
+            for email in emails:
+                await lease.keep_alive()
+                if not lease.holds(email):
+                    continue
+                recipients = email.recipients or credentials.receivers
+                if not recipients:
+                    errors[email.id] = (
+                        "No se encontraron correos para recibir el mensaje"
+                    )
+                    continue
+                try:
+                    # A failed send discards its session, lease a fresh one.
+                    if not provider.conn:
+                        await provider.auth()
+                    await provider.send(
+                        recipient=recipients,
+                        sender=credentials.user,
+                        subject=email.subject,
+                        message=email.body,
+                    )
+                except ErrorSendingEmailException as e:
+                    errors[email.id] = str(e)
+        finally:
+            await provider.close()
+        return errors
+
+    def _retry_in(self, attempts: int) -> float | None:
+        if attempts >= self.max_attempts:
+            return None
+        return min(self.backoff_base * 2 ** (attempts - 1), self.backoff_max)
+
+    async def run(self) -> None:
+        self._stopping.clear()
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+            except Exception as e:
+                logger.error(f"Error procesando la bandeja de salida: {e}")
+                processed = 0
+
+            # A full batch means there is a backlog, keep draining it.
+            if processed >= self.batch_size:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+
+email_outbox_worker = EmailOutboxWorker(
+    batch_size=int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "50")),
+    poll_interval=float(os.getenv("EMAIL_OUTBOX_POLL_SECONDS", "5")),
+    max_attempts=int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5")),
+    backoff_base=float(os.getenv("EMAIL_OUTBOX_BACKOFF_SECONDS", "30")),
+    backoff_max=float(os.getenv("EMAIL_OUTBOX_BACKOFF_MAX_SECONDS", "3600")),
+    lease_seconds=float(os.getenv("EMAIL_OUTBOX_LEASE_SECONDS", "300")),
+    send_timeout=smtp_pool.timeout,
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Deliver queued outbox emails")
+    parser.add_argument(
+        "--once", action="store_true", help="process a single batch and exit"
+    )
+    args = parser.parse_args()
+
+    configure_logging()
+    if args.once:
+        asyncio.run(email_outbox_worker.run_once())
+    else:
+        asyncio.run(email_outbox_worker.run())
@@ -1,10 +1,11 @@
-from src.common.loggin_config import setup_logger
+import logging
+
 from src.smtp.application.interfaces import SMTPProviderInterface
-from src.smtp.application.schemas import FilterParams
 from src.smtp.dependencies.hostinger_smtp import SMTPHostinger
 from src.smtp.infrastructure.database import ORMSMTPRepository
+from src.smtp.utils.email_templates import email_templates
 
-logger = setup_logger()
+logger = logging.getLogger(__name__)
 
 
 async def wrapped_send_email(
@@ -14,37 +15,46 @@ async def wrapped_send_email(
     email: str | list[str] = None,
 ):
     await smtp_provider.auth()
-    credentials = await smtp_provider.get_smtp_credentials()
-    await smtp_provider.send(
-        recipient=email,
-        sender=credentials.user,
-        subject=subject,
-        message=message,
-    )
+    try:
+        credentials = await smtp_provider.get_smtp_credentials()
+        await smtp_provider.send(
+            recipient=email,
+            sender=credentials.user,
+            subject=subject,
+            message=message,
+        )
+    finally:
+        await smtp_provider.close()
 
 
 async def send_email(
     db,
-    subject: str,
-    message: str,
+    subject: str = None,
+    message: str = None,
     email: str = None,
+    *,
+    template: str | None = None,
+    context: dict | None = None,
+    locale: str | None = None,
 ):
+    if template:
+        rendered = email_templates.render(template, context, locale=locale)
+        subject, message = rendered.subject, rendered.body
+
     smtp_repository = ORMSMTPRepository(db=db)
     hostinger_smtp_provider = await SMTPHostinger.create(
         smtp_repository=smtp_repository
     )
-    filter_params = FilterParams()
-    smtp_config, _ = await smtp_repository.get(filter_params=filter_params)
+    smtp_config = await hostinger_smtp_provider.get_smtp_credentials()
     if not smtp_config:
         logger.error("Configuración SMTP no encontrada")
         return (False, "Configuración SMTP no encontrada")
 
     if not email:
-        receivers = smtp_config[0].receivers
-        if not receivers:
+        if not smtp_config.receivers:
             logger.error("No se encontraron correos para recibir el mensaje")
             return (False, "No se encontraron correos para recibir el mensaje")
-        email = smtp_config[0].receivers
+        email = smtp_config.receivers
 
     await wrapped_send_email(
         smtp_provider=hostinger_smtp_provider,
@@ -0,0 +1,258 @@
+import asyncio
+import hashlib
+import logging
+import os
+import smtplib
+import ssl
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+from src.smtp.application.schemas import SMTPBase
+
+logger = logging.getLogger(__name__)
+
+SMTP_SSL_PORT = "465"
+
+
+@dataclass
+class PooledConnection:
+    key: tuple
+    conn: smtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    # smtplib call still running in its thread after the caller gave up.
+    busy: asyncio.Future | None = None
+    closed: bool = False
+
+
+@dataclass
+class _KeyPool:
+    semaphore: asyncio.Semaphore
+    idle: deque = field(default_factory=deque)
+    leased: int = 0
+
+
+def _close_late_connection(future: asyncio.Future) -> None:
+    # A login that finished after its caller timed out must not stay open.
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class SMTPConnectionPool:
+    """
+    Keeps authenticated SMTP sessions alive and reuses them across emails.
+
+    Sessions are pooled per credentials, with at most `max_connections`
+    leased at once per key. Idle sessions are checked with NOOP before reuse
+    and dropped after `idle_timeout` seconds. All smtplib calls run in a
+    worker thread bounded by `timeout`; a connection whose call timed out is
+    closed only once that thread returns. When the credentials change, the
+    pools of the previous ones are closed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int,
+        idle_timeout: float,
+        health_check_interval: float,
+        timeout: float,
+    ):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self._pools: dict[tuple, _KeyPool] = {}
+        self._current_key: tuple | None = None
+        self._closing: set[asyncio.Task] = set()
+        self.opened = 0
+        self.reused = 0
+        self.discarded = 0
+
+    @staticmethod
+    def _key(credentials: SMTPBase) -> tuple:
+        password_hash = hashlib.sha256(credentials.password.encode("utf-8")).hexdigest()
+        return (credentials.host, str(credentials.port), credentials.user, password_hash)
+
+    def _pool(self, key: tuple) -> _KeyPool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = _KeyPool(semaphore=asyncio.Semaphore(self.max_connections))
+            self._pools[key] = pool
+        return pool
+
+    async def _call(self, pooled: PooledConnection, func, *args):
+        future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except BaseException:
+            if not future.done():
+                pooled.busy = future
+            raise
+
+    async def _open(self, credentials: SMTPBase, key: tuple) -> PooledConnection:
+        future = asyncio.ensure_future(asyncio.to_thread(self._connect, credentials))
+        try:
+            conn = await asyncio.wait_for(asyncio.shield(future), self.timeout)
+        except BaseException:
+            if not future.done():
+                future.add_done_callback(_close_late_connection)
+            raise
+        self.opened += 1
+        return PooledConnection(key=key, conn=conn)
+
+    async def _drop_stale_pools(self) -> None:
+        for key, pool in list(self._pools.items()):
+            if key == self._current_key:
+                continue
+            while pool.idle:
+                await self._close(pool.idle.pop())
+            # Leased sessions are closed when they come back, see `release`.
+            if not pool.leased:
+                del self._pools[key]
+
+    def _connect(self, credentials: SMTPBase) -> smtplib.SMTP:
+        if str(credentials.port) == SMTP_SSL_PORT:
+            conn = smtplib.SMTP_SSL(
+                credentials.host,
+                int(credentials.port),
+                context=ssl.create_default_context(),
+                timeout=self.timeout,
+            )
+        else:
+            conn = smtplib.SMTP(
+                credentials.host, int(credentials.port), timeout=self.timeout
+            )
+            conn.ehlo()
+            if conn.has_extn("starttls"):
+                conn.starttls(context=ssl.create_default_context())
+                conn.ehlo()
+
+        conn.set_debuglevel(credentials.debug)
+        conn.login(credentials.user, credentials.password)
+        return conn
+
+    async def _is_alive(self, pooled: PooledConnection) -> bool:
+        try:
+            code, _ = await self._call(pooled, pooled.conn.noop)
+            return code == 250
+        except (OSError, smtplib.SMTPException, asyncio.TimeoutError):
+            return False
+
+    async def acquire(self, credentials: SMTPBase) -> PooledConnection:
+        key = self._key(credentials)
+        if key != self._current_key:
+            self._current_key = key
+            await self._drop_stale_pools()
+        pool = self._pool(key)
+        await pool.semaphore.acquire()
+        pool.leased += 1
+
+        try:
+            while pool.idle:
+                pooled = pool.idle.pop()
+                idle_for = time.monotonic() - pooled.last_used
+                if idle_for > self.idle_timeout:
+                    await self._close(pooled)
+                    continue
+                if idle_for > self.health_check_interval and not await self._is_alive(
+                    pooled
+                ):
+                    await self._close(pooled)
+                    continue
+                self.reused += 1
+                return pooled
+
+            return await self._open(credentials, key)
+        except BaseException:
+            pool.leased -= 1
+            pool.semaphore.release()
+            raise
+
+    async def release(self, pooled: PooledConnection, *, discard: bool = False) -> None:
+        pool = self._pools[pooled.key]
+        stale = pooled.key != self._current_key
+        if discard or stale or pooled.busy is not None:
+            await self._close(pooled)
+        else:
+            pooled.last_used = time.monotonic()
+            pool.idle.append(pooled)
+        pool.leased -= 1
+        pool.semaphore.release()
+        if stale and not pool.leased:
+            self._pools.pop(pooled.key, None)
+
+    async def sendmail(
+        self,
+        pooled: PooledConnection,
+        *,
+        credentials: SMTPBase,
+        sender: str,
+        recipients: str | list[str],
+        message: str,
+    ) -> PooledConnection:
+        """
+        Send through a leased session, reconnecting once if the server
+        dropped it. Returns the session that ended up being used.
+        """
+        try:
+            await self._call(pooled, pooled.conn.sendmail, sender, recipients, message)
+            return pooled
+        except smtplib.SMTPServerDisconnected:
+            await self._close(pooled)
+
+        # If this fails, the caller discards `pooled` again, which is a no-op.
+        pooled = await self._open(credentials, pooled.key)
+        await self._call(pooled, pooled.conn.sendmail, sender, recipients, message)
+        return pooled
+
+    async def _close(self, pooled: PooledConnection) -> None:
+        if pooled.closed:
+            return
+        pooled.closed = True
+        self.discarded += 1
+        if pooled.busy is None:
+            try:
+                await self._call(pooled, pooled.conn.quit)
+                return
+            except (OSError, smtplib.SMTPException, asyncio.TimeoutError):
+                pass
+        if pooled.busy is None:
+            pooled.conn.close()
+            return
+        # The thread is still using the socket (mid-command, so no QUIT
+        # either): close it once the thread returns.
+        task = asyncio.create_task(self._close_when_idle(pooled))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close_when_idle(pooled: PooledConnection) -> None:
+        await asyncio.wait([pooled.busy])
+        if not pooled.busy.cancelled():
+            pooled.busy.exception()
+        pooled.conn.close()
+
+    async def close_all(self) -> None:
+        for pool in self._pools.values():
+            while pool.idle:
+                await self._close(pool.idle.pop())
+        if self._closing:
+            await asyncio.wait(set(self._closing))
+
+    def stats(self) -> dict:
+        return {
+            "keys": len(self._pools),
+            "idle": sum(len(pool.idle) for pool in self._pools.values()),
+            "opened": self.opened,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+
+smtp_pool = SMTPConnectionPool(
+    max_connections=int(os.getenv("SMTP_POOL_MAX_CONNECTIONS", "4")),
+    idle_timeout=float(os.getenv("SMTP_POOL_IDLE_TIMEOUT_SECONDS", "300")),
+    health_check_interval=float(os.getenv("SMTP_POOL_HEALTH_CHECK_SECONDS", "30")),
+    timeout=float(os.getenv("SMTP_TIMEOUT_SECONDS", "10")),
+)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+@dataclass
+class OutboxEmail:
+    id: int
+    recipients: Optional[list[str]]
+    subject: Optional[str]
+    body: Optional[str]
+    attempts: int
+    template: Optional[str] = None
+    context: Optional[dict] = None
+    locale: Optional[str] = None
@@ -11,6 +11,10 @@ class ErrorSendingEmailException(Exception):
     pass
 
 
+class EmailTemplateNotFoundException(Exception):
+    pass
+
+
 async def smtp_not_found_handler(request: Request, exc: SMTPNotFoundException):
     return std_response(
         status_code=status.HTTP_404_NOT_FOUND,
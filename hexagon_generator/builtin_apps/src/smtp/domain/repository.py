@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from src.smtp.domain.entities import OutboxEmail
 from src.smtp.domain.models import SMTP
 
 
@@ -7,13 +8,45 @@ class SMTPRepository(ABC):
     async def get_by_id(self, *, id: int) -> SMTP: ...
 
     @abstractmethod
-    async def get(self, *, id: int, filter_params) -> tuple[list[SMTP], int]: ...
+    async def get(self, *, filter_params) -> tuple[list[SMTP], int]: ...
 
     @abstractmethod
-    async def create(self, *, data): ...
+    async def create(self, *, data) -> SMTP: ...
 
     @abstractmethod
-    async def update(self, *, id: int, data): ...
+    async def update(self, *, id: int, data) -> SMTP: ...
 
     @abstractmethod
-    async def delete(self, *, id: int): ...
+    async def delete(self, *, id: int) -> SMTP: ...
+
+
+class EmailOutboxRepository(ABC):
+    @abstractmethod
+    async def enqueue(
+        self,
+        *,
+        recipients: list[str] | None,
+        subject: str | None = None,
+        body: str | None = None,
+        template: str | None = None,
+        context: dict | None = None,
+        locale: str | None = None,
+    ) -> None: ...
+
+    @abstractmethod
+    async def claim_batch(
+        self, *, limit: int, lease_seconds: float
+    ) -> list[OutboxEmail]: ...
+
+    @abstractmethod
+    async def renew_lease(
+        self, *, emails: list[OutboxEmail], lease_seconds: float
+    ) -> set[int]: ...
+
+    @abstractmethod
+    async def mark_sent(self, *, ids: list[int]) -> None: ...
+
+    @abstractmethod
+    async def mark_failed(
+        self, *, id: int, error: str, retry_in: float | None
+    ) -> None: ...
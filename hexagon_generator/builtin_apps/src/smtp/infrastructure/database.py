@@ -1,58 +1,230 @@
+import logging
+import os
+from datetime import timedelta
+
+from sqlalchemy import delete, func, null, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.common.utils.on_commit import run_after_commit
 from src.smtp.application.schemas import (
     CreateSMTPRequest,
     FilterParams,
     SMTPInDBBase,
     UpdateSMTPRequest,
 )
+from src.smtp.domain.entities import OutboxEmail, OutboxStatus
 from src.smtp.domain.exceptions import SMTPNotFoundException
 from src.smtp.domain.models import SMTP
-from src.smtp.domain.repository import SMTPRepository
+from src.smtp.domain.repository import EmailOutboxRepository, SMTPRepository
+from src.smtp.infrastructure.models import EmailOutboxORM
+from src.smtp.utils.smtp_config_cache import smtp_config_cache
+
+logger = logging.getLogger(__name__)
+
+# Set when the worker runs as its own process, so the API does not warn.
+EXTERNAL_WORKER = os.getenv("EMAIL_OUTBOX_EXTERNAL_WORKER", "false").lower() == "true"
+_missing_worker_logged = False
+
+
+def _warn_if_no_worker() -> None:
+    global _missing_worker_logged
+    if EXTERNAL_WORKER or _missing_worker_logged:
+        return
+    # Imported here: the worker module imports this one.
+    from src.smtp.dependencies.outbox_worker import email_outbox_worker
+
+    if not email_outbox_worker.running:
+        _missing_worker_logged = True
+        logger.warning(
+            "Correo encolado pero no hay worker de la bandeja de salida en este "
+            "proceso: registra email_outbox_worker en src/common/lifespan.py o "
+            "ejecuta python -m src.smtp.dependencies.outbox_worker "
+            "(EMAIL_OUTBOX_EXTERNAL_WORKER=true silencia este aviso)"
+        )
 
 
 class ORMSMTPRepository(SMTPRepository):
-    def __init__(self, *, db):
+    def __init__(self, *, db: AsyncSession):
         self.db = db
 
     async def get_by_id(self, *, id: int) -> SMTP:
-        existing_smtp = self.db.query(SMTP).filter(SMTP.id == id).first()
+        result = await self.db.execute(select(SMTP).where(SMTP.id == id))
+        existing_smtp = result.scalar_one_or_none()
         if not existing_smtp:
             raise SMTPNotFoundException(f"SMTP con id {id} no encontrado")
         return existing_smtp
 
     async def get(self, *, filter_params: FilterParams) -> tuple[list[SMTP], int]:
-        filters_ = {}
-        smtp_query = self.db.query(SMTP).filter_by(**filters_).order_by(SMTP.id.desc())
-        count = smtp_query.count()
-        smtp = smtp_query.offset(filter_params.skip).limit(filter_params.limit).all()
-        return smtp, count
-
-    async def create(self, *, data: CreateSMTPRequest):
-        data_ = data.model_dump()
-        smtp_result = SMTP(**data_)
+        count = await self.db.scalar(select(func.count()).select_from(SMTP))
+        stmt = (
+            select(SMTP)
+            .order_by(SMTP.id.desc())
+            .offset(filter_params.skip)
+            .limit(filter_params.limit)
+        )
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all()), count
+
+    async def create(self, *, data: CreateSMTPRequest) -> SMTP:
+        smtp_result = SMTP(**data.model_dump())
         self.db.add(smtp_result)
-        self.db.flush()
-        self.db.refresh(smtp_result)
+        await self.db.flush()
+        run_after_commit(self.db, smtp_config_cache.invalidate)
         return smtp_result
 
-    async def update(self, *, id: int, data: UpdateSMTPRequest):
+    async def update(self, *, id: int, data: UpdateSMTPRequest) -> SMTP:
         data_ = data.model_dump(exclude_none=True)
-        smtp_result = (
-            self.db.query(SMTP)
-            .filter(SMTP.id == id)
-            .update(data_, synchronize_session="fetch")
-        )
+        if not data_:
+            return await self.get_by_id(id=id)
 
-        if smtp_result == 0:
+        stmt = update(SMTP).where(SMTP.id == id).values(**data_).returning(SMTP)
+        result = await self.db.execute(stmt)
+        updated_smtp = result.scalar_one_or_none()
+        if not updated_smtp:
             raise SMTPNotFoundException(f"SMTP con id {id} no encontrado")
 
-        updated_smtp = self.db.query(SMTP).filter(SMTP.id == id).first()
-        self.db.refresh(updated_smtp)
+        run_after_commit(self.db, smtp_config_cache.invalidate)
         return updated_smtp
 
-    async def delete(self, *, id: int):
-        existing_smtp = self.db.query(SMTP).filter(SMTP.id == id).first()
-        if not existing_smtp:
+    async def delete(self, *, id: int) -> SMTP:
+        stmt = delete(SMTP).where(SMTP.id == id).returning(SMTP)
+        result = await self.db.execute(stmt)
+        deleted_smtp = result.scalar_one_or_none()
+        if not deleted_smtp:
             raise SMTPNotFoundException(f"SMTP con id {id} no encontrado")
 
-        self.db.delete(existing_smtp)
-        self.db.flush()
+        run_after_commit(self.db, smtp_config_cache.invalidate)
+        return deleted_smtp
+
+
+class ORMEmailOutboxRepository(EmailOutboxRepository):
+    def __init__(self, *, db: AsyncSession):
+        self.db = db
+
+    async def enqueue(
+        self,
+        *,
+        recipients: list[str] | None,
+        subject: str | None = None,
+        body: str | None = None,
+        template: str | None = None,
+        context: dict | None = None,
+        locale: str | None = None,
+    ) -> None:
+        self.db.add(
+            EmailOutboxORM(
+                recipients=recipients,
+                subject=subject,
+                body=body,
+                template=template,
+                context=context,
+                locale=locale,
+            )
+        )
+        _warn_if_no_worker()
+
+    async def claim_batch(
+        self, *, limit: int, lease_seconds: float
+    ) -> list[OutboxEmail]:
+        # Rows left in "sending" by a crashed worker become due again once
+        # their lease expires.
+        due = (
+            select(EmailOutboxORM.id)
+            .where(
+                EmailOutboxORM.status.in_(
+                    [OutboxStatus.PENDING.value, OutboxStatus.SENDING.value]
+                ),
+                EmailOutboxORM.next_attempt_at <= func.now(),
+            )
+            .order_by(EmailOutboxORM.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(EmailOutboxORM)
+            .where(EmailOutboxORM.id.in_(due))
+            .values(
+                status=OutboxStatus.SENDING.value,
+                attempts=EmailOutboxORM.attempts + 1,
+                next_attempt_at=func.now() + timedelta(seconds=lease_seconds),
+            )
+            .returning(
+                EmailOutboxORM.id,
+                EmailOutboxORM.recipients,
+                EmailOutboxORM.subject,
+                EmailOutboxORM.body,
+                EmailOutboxORM.attempts,
+                EmailOutboxORM.template,
+                EmailOutboxORM.context,
+                EmailOutboxORM.locale,
+            )
+        )
+        result = await self.db.execute(stmt)
+        return [
+            OutboxEmail(
+                id=row.id,
+                recipients=row.recipients,
+                subject=row.subject,
+                body=row.body,
+                attempts=row.attempts,
+                template=row.template,
+                context=row.context,
+                locale=row.locale,
+            )
+            for row in result.all()
+        ]
+
+    async def renew_lease(
+        self, *, emails: list[OutboxEmail], lease_seconds: float
+    ) -> set[int]:
+        """
+        Push back the lease of claimed emails and return the ids still held.
+
+        An email whose lease already ran out may have been claimed again by
+        another worker, which bumped its attempts; those are left alone.
+        """
+        if not emails:
+            return set()
+        stmt = (
+            update(EmailOutboxORM)
+            .where(
+                EmailOutboxORM.status == OutboxStatus.SENDING.value,
+                tuple_(EmailOutboxORM.id, EmailOutboxORM.attempts).in_(
+                    [(email.id, email.attempts) for email in emails]
+                ),
+            )
+            .values(next_attempt_at=func.now() + timedelta(seconds=lease_seconds))
+            .returning(EmailOutboxORM.id)
+        )
+        result = await self.db.execute(stmt)
+        return set(result.scalars().all())
+
+    async def mark_sent(self, *, ids: list[int]) -> None:
+        if not ids:
+            return
+        stmt = (
+            update(EmailOutboxORM)
+            .where(EmailOutboxORM.id.in_(ids))
+            .values(
+                status=OutboxStatus.SENT.value,
+                sent_at=func.now(),
+                last_error=None,
+                # The context can hold credentials (the reset link's JWT);
+                # keep it only while the email may still be sent.
+                context=null(),
+            )
+        )
+        await self.db.execute(stmt)
+
+    async def mark_failed(
+        self, *, id: int, error: str, retry_in: float | None
+    ) -> None:
+        values = {"last_error": error}
+        if retry_in is None:
+            values["status"] = OutboxStatus.FAILED.value
+            values["context"] = null()
+        else:
+            values["status"] = OutboxStatus.PENDING.value
+            values["next_attempt_at"] = func.now() + timedelta(seconds=retry_in)
+        stmt = update(EmailOutboxORM).where(EmailOutboxORM.id == id).values(**values)
+        await self.db.execute(stmt)
@@ -0,0 +1,43 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.common.database_connection import Base
+from src.smtp.domain.entities import OutboxStatus
+
+# Imported so models_import() (alembic, permission seeding) sees the SMTP table.
+from src.smtp.domain.models import SMTP  # noqa: F401
+
+
+class EmailOutboxORM(Base):
+    __tablename__ = "EmailOutbox"
+    __table_args__ = (
+        Index("ix_EmailOutbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    recipients: Mapped[Optional[list[str]]] = mapped_column(JSON, nullable=True)
+    subject: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    body: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    template: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    context: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    locale: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, default=OutboxStatus.PENDING.value
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    sent_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"<EmailOutboxORM(id={self.id}, status={self.status})>"
@@ -1,7 +1,7 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies.get_user_with_permissions import get_user_with_permission
 from src.common.database_connection import get_db
@@ -29,20 +29,36 @@ from src.smtp.application.use_cases import (
 )
 from src.smtp.dependencies.send_email import send_email
 from src.smtp.infrastructure.database import ORMSMTPRepository
+from src.smtp.infrastructure.unit_of_work import SQLAlchemyUnitOfWork
 
 router = APIRouter()
 
 
+# --- Dependencies ---
+
+
+def get_repository(db: AsyncSession = Depends(get_db)) -> ORMSMTPRepository:
+    return ORMSMTPRepository(db=db)
+
+
+def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> SQLAlchemyUnitOfWork:
+    return SQLAlchemyUnitOfWork(session=db)
+
+
+Repository = Annotated[ORMSMTPRepository, Depends(get_repository)]
+UoW = Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)]
+
+
 @router.post("/create", response_model=StandardResponse[SMTPInDBBase])
 async def create_endpoint(
     create_smtp_request: CreateSMTPRequest,
-    database: Session = Depends(get_db),
+    smtp_repo: Repository,
+    unit_of_work: UoW,
     _=Depends(get_user_with_permission("smtp.create")),
 ):
-    smtp_repo = ORMSMTPRepository(db=database)
     smtp_service = SMTPService()
     create_use_case = CreateUseCase(
-        database=database, smtp_repository=smtp_repo, smtp_service=smtp_service
+        unit_of_work=unit_of_work, smtp_repository=smtp_repo, smtp_service=smtp_service
     )
     result = await create_handler(
         create_smtp_request=create_smtp_request, create_use_case=create_use_case
@@ -53,13 +69,13 @@ async def create_endpoint(
 @router.get("/list", response_model=StandardResponse[list[SMTPInDBBase]])
 async def list_endpoint(
     filter_params: Annotated[FilterParams, Query()],
-    database: Session = Depends(get_db),
+    smtp_repo: Repository,
+    unit_of_work: UoW,
     _=Depends(get_user_with_permission("smtp.list")),
 ):
-    smtp_repo = ORMSMTPRepository(db=database)
     smtp_service = SMTPService()
     list_use_case = ListUseCase(
-        database=database, smtp_repository=smtp_repo, smtp_service=smtp_service
+        unit_of_work=unit_of_work, smtp_repository=smtp_repo, smtp_service=smtp_service
     )
     result, count = await list_handler(
         filter_params=filter_params, list_use_case=list_use_case
@@ -70,13 +86,13 @@ async def list_endpoint(
 @router.get("/{smtp_id}/retrieve", response_model=StandardResponse[SMTPInDBBase])
 async def retrieve_endpoint(
     smtp_id: int,
-    database: Session = Depends(get_db),
+    smtp_repo: Repository,
+    unit_of_work: UoW,
     _=Depends(get_user_with_permission("smtp.get")),
 ):
-    smtp_repo = ORMSMTPRepository(db=database)
     smtp_service = SMTPService()
     retrieve_use_case = RetrieveUseCase(
-        database=database, smtp_repository=smtp_repo, smtp_service=smtp_service
+        unit_of_work=unit_of_work, smtp_repository=smtp_repo, smtp_service=smtp_service
     )
     result = await retrieve_handler(
         smtp_id=smtp_id, retrieve_use_case=retrieve_use_case
@@ -88,13 +104,13 @@ async def retrieve_endpoint(
 async def update_endpoint(
     smtp_id: int,
     update_smtp_request: UpdateSMTPRequest,
-    database: Session = Depends(get_db),
+    smtp_repo: Repository,
+    unit_of_work: UoW,
     _=Depends(get_user_with_permission("smtp.update")),
 ):
-    smtp_repo = ORMSMTPRepository(db=database)
     smtp_service = SMTPService()
     update_use_case = UpdateUseCase(
-        database=database, smtp_repository=smtp_repo, smtp_service=smtp_service
+        unit_of_work=unit_of_work, smtp_repository=smtp_repo, smtp_service=smtp_service
     )
     result = await update_handler(
         smtp_id=smtp_id,
@@ -107,13 +123,13 @@ async def update_endpoint(
 @router.delete("/{smtp_id}/delete", response_model=StandardResponse[SMTPInDBBase])
 async def delete_endpoint(
     smtp_id: int,
-    database: Session = Depends(get_db),
+    smtp_repo: Repository,
+    unit_of_work: UoW,
     _=Depends(get_user_with_permission("smtp.delete")),
 ):
-    smtp_repo = ORMSMTPRepository(db=database)
     smtp_service = SMTPService()
     delete_use_case = DeleteUseCase(
-        database=database, smtp_repository=smtp_repo, smtp_service=smtp_service
+        unit_of_work=unit_of_work, smtp_repository=smtp_repo, smtp_service=smtp_service
     )
     result = await delete_handler(smtp_id=smtp_id, delete_use_case=delete_use_case)
     return std_response(data=result)
@@ -121,10 +137,10 @@ async def delete_endpoint(
 
 @router.post("/test-email", response_model=StandardResponse)
 async def test_email(
-    database: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     task_args = {
-        "db": database,
+        "db": db,
         "subject": "Correo de prueba",
         "message": "Tu configuración SMTP funciona correctamente",
     }
@@ -132,5 +148,4 @@ async def test_email(
     if not was_sent:
         return std_response(status_code=status.HTTP_400_BAD_REQUEST, ok=False, msg=msg)
 
-    database.commit()
     return std_response()
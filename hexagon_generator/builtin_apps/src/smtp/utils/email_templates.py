@@ -0,0 +1,99 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
+
+from src.smtp.domain.exceptions import EmailTemplateNotFoundException
+
+TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates"
+
+
+@dataclass
+class RenderedEmail:
+    subject: str
+    body: str
+
+
+class EmailTemplateRenderer:
+    """
+    Renders transactional emails from `templates/<locale>/<name>.*`.
+
+    Each email is a pair of files: `<name>.subject.txt` and `<name>.html`.
+    Templates are compiled once and kept for the life of the process; a
+    locale without its own variant falls back to `default_locale`.
+    """
+
+    def __init__(self, *, templates_dir: Path, default_locale: str):
+        self.templates_dir = templates_dir
+        self.default_locale = default_locale
+        self.environment = Environment(
+            loader=FileSystemLoader(str(templates_dir)),
+            autoescape=select_autoescape(["html"]),
+            auto_reload=False,
+            cache_size=-1,
+        )
+        self.locales = sorted(
+            path.name for path in templates_dir.iterdir() if path.is_dir()
+        )
+        self._compiled: dict[tuple[str, str], tuple[Template, Template]] = {}
+
+    def resolve_locale(self, locale: str | None) -> str:
+        """Pick a supported locale from a tag or an Accept-Language header."""
+        if not locale:
+            return self.default_locale
+        for part in locale.split(","):
+            tag = part.split(";")[0].strip().lower()
+            for candidate in (tag, tag.split("-")[0]):
+                if candidate in self.locales:
+                    return candidate
+        return self.default_locale
+
+    async def preload(self) -> None:
+        """Compile every template upfront so the first emails pay no cost."""
+        for locale in self.locales:
+            for path in (self.templates_dir / locale).glob("*.html"):
+                self._get_templates(path.stem, locale)
+
+    def render(
+        self, name: str, context: dict | None = None, *, locale: str | None = None
+    ) -> RenderedEmail:
+        return self.render_many(name, [context or {}], locale=locale)[0]
+
+    def render_many(
+        self, name: str, contexts: list[dict], *, locale: str | None = None
+    ) -> list[RenderedEmail]:
+        subject, body = self._get_templates(name, self.resolve_locale(locale))
+        return [
+            RenderedEmail(
+                subject=subject.render(context).strip(), body=body.render(context)
+            )
+            for context in contexts
+        ]
+
+    def _get_templates(self, name: str, locale: str) -> tuple[Template, Template]:
+        key = (name, locale)
+        templates = self._compiled.get(key)
+        if templates is not None:
+            return templates
+
+        for candidate in (locale, self.default_locale):
+            if (self.templates_dir / candidate / f"{name}.html").is_file():
+                templates = (
+                    self.environment.get_template(f"{candidate}/{name}.subject.txt"),
+                    self.environment.get_template(f"{candidate}/{name}.html"),
+                )
+                break
+        else:
+            raise EmailTemplateNotFoundException(
+                f"Plantilla de correo {name} no encontrada"
+            )
+
+        self._compiled[key] = templates
+        return templates
+
+
+email_templates = EmailTemplateRenderer(
+    templates_dir=TEMPLATES_DIR,
+    default_locale=os.getenv("EMAIL_DEFAULT_LOCALE", "es"),
+)
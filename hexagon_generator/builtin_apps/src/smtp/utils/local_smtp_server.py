@@ -0,0 +1,153 @@
+"""
+Minimal asyncio SMTP server to stand in for the real mail provider.
+
+It speaks just enough SMTP for smtplib (EHLO, AUTH PLAIN, MAIL, RCPT, DATA,
+NOOP, RSET, QUIT), keeps every received message in memory and can add an
+artificial delay to each reply to mimic a slow provider.
+
+Run it locally with:
+
+    python -m src.smtp.utils.local_smtp_server --port 1025
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ReceivedMessage:
+    sender: str
+    recipients: list[str]
+    data: str
+
+
+@dataclass
+class _Envelope:
+    sender: str | None = None
+    recipients: list[str] = field(default_factory=list)
+
+
+class LocalSMTPServer:
+    def __init__(
+        self, *, host: str = "127.0.0.1", port: int = 0, response_delay: float = 0.0
+    ):
+        self.host = host
+        self.port = port
+        self.response_delay = response_delay
+        self.messages: list[ReceivedMessage] = []
+        self.connections = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.close()
+            clients = list(self._clients.items())
+            for writer, _ in clients:
+                writer.close()
+            await asyncio.gather(*(task for _, task in clients), return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LocalSMTPServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    async def _reply(self, writer: asyncio.StreamWriter, line: str) -> None:
+        if self.response_delay:
+            await asyncio.sleep(self.response_delay)
+        writer.write(f"{line}\r\n".encode("utf-8"))
+        await writer.drain()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self._clients[writer] = asyncio.current_task()
+        envelope = _Envelope()
+        await self._reply(writer, "220 localhost ESMTP stand-in")
+
+        try:
+            while line := await reader.readline():
+                command = line.decode("utf-8").rstrip("\r\n")
+                verb = command.split(" ", 1)[0].upper()
+
+                if verb == "EHLO":
+                    await self._reply(writer, "250-localhost\r\n250-AUTH PLAIN\r\n250 OK")
+                elif verb == "HELO":
+                    await self._reply(writer, "250 localhost")
+                elif verb == "AUTH":
+                    await self._reply(writer, "235 Authentication successful")
+                elif verb == "MAIL":
+                    envelope = _Envelope(sender=self._address(command))
+                    await self._reply(writer, "250 OK")
+                elif verb == "RCPT":
+                    envelope.recipients.append(self._address(command))
+                    await self._reply(writer, "250 OK")
+                elif verb == "DATA":
+                    await self._reply(writer, "354 End data with <CR><LF>.<CR><LF>")
+                    self.messages.append(
+                        ReceivedMessage(
+                            sender=envelope.sender or "",
+                            recipients=envelope.recipients,
+                            data=await self._read_data(reader),
+                        )
+                    )
+                    envelope = _Envelope()
+                    await self._reply(writer, "250 OK queued")
+                elif verb in ("NOOP", "RSET"):
+                    if verb == "RSET":
+                        envelope = _Envelope()
+                    await self._reply(writer, "250 OK")
+                elif verb == "QUIT":
+                    await self._reply(writer, "221 Bye")
+                    break
+                else:
+                    await self._reply(writer, "502 Command not implemented")
+        except ConnectionError:
+            pass
+        finally:
+            self._clients.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    def _address(command: str) -> str:
+        _, _, value = command.partition(":")
+        return value.strip().split(" ", 1)[0].strip("<>")
+
+    @staticmethod
+    async def _read_data(reader: asyncio.StreamReader) -> str:
+        lines = []
+        while True:
+            line = (await reader.readline()).decode("utf-8").rstrip("\r\n")
+            if line == ".":
+                break
+            lines.append(line[1:] if line.startswith("..") else line)
+        return "\n".join(lines)
+
+
+async def _serve(host: str, port: int, response_delay: float) -> None:
+    server = LocalSMTPServer(host=host, port=port, response_delay=response_delay)
+    await server.start()
+    print(f"Local SMTP server listening on {server.host}:{server.port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local SMTP stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    parser.add_argument("--response-delay", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(_serve(args.host, args.port, args.response_delay))
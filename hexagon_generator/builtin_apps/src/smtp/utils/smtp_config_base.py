@@ -1,27 +1,11 @@
-from src.common.loggin_config import setup_logger
-from src.smtp.application.schemas import FilterParams, SMTPBase
-from src.smtp.domain.exceptions import SMTPNotFoundException
+from src.smtp.application.schemas import SMTPBase
 from src.smtp.domain.repository import SMTPRepository
-
-logger = setup_logger()
+from src.smtp.utils.smtp_config_cache import smtp_config_cache
 
 
 class SMTPConfigBase:
     def __init__(self, *, smtp_repository: SMTPRepository):
         self.smtp_repository = smtp_repository
 
-    async def generate_smtp_credentials(self) -> SMTPBase:
-        filter_params = FilterParams()
-        credentials, count = await self.smtp_repository.get(filter_params=filter_params)
-        if count == 0:
-            logger.error("Configuración SMTP no encontrada")
-            return
-        credentials = credentials[0]
-        result = SMTPBase(
-            host=credentials.server,
-            port=credentials.port,
-            user=credentials.user,
-            password=credentials.password,
-            debug=True,
-        )
-        return result
+    async def generate_smtp_credentials(self) -> SMTPBase | None:
+        return await smtp_config_cache.get(self.smtp_repository)
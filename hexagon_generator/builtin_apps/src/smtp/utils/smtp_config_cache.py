@@ -0,0 +1,70 @@
+import asyncio
+import logging
+import os
+import time
+
+from src.smtp.application.schemas import FilterParams, SMTPBase
+from src.smtp.domain.repository import SMTPRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPConfigCache:
+    """
+    Process-wide cache of the active SMTP configuration.
+
+    The configuration is kept for `ttl_seconds`, so sending a batch of emails
+    costs no queries. An SMTP create, update or delete reloads it right away
+    in the process that committed it; other processes (API workers, the
+    outbox worker) pick it up when the TTL runs out. A missing configuration
+    is never cached.
+    """
+
+    def __init__(self, *, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._config: SMTPBase | None = None
+        self._loaded_at = float("-inf")
+        self._invalidations = 0
+        self._lock = asyncio.Lock()
+
+    def _fresh(self) -> bool:
+        return time.monotonic() - self._loaded_at < self.ttl_seconds
+
+    async def get(self, smtp_repository: SMTPRepository) -> SMTPBase | None:
+        if self._fresh():
+            return self._config
+
+        async with self._lock:
+            if self._fresh():
+                return self._config
+
+            loaded_at, invalidations = time.monotonic(), self._invalidations
+            smtp_config, count = await smtp_repository.get(
+                filter_params=FilterParams(limit=1)
+            )
+            if count == 0:
+                logger.error("Configuración SMTP no encontrada")
+                self._config = None
+                return None
+
+            credentials = smtp_config[0]
+            self._config = SMTPBase(
+                host=credentials.server,
+                port=credentials.port,
+                user=credentials.user,
+                password=credentials.password,
+                receivers=credentials.receivers,
+                debug=True,
+            )
+            if invalidations == self._invalidations:
+                self._loaded_at = loaded_at
+            return self._config
+
+    def invalidate(self) -> None:
+        self._invalidations += 1
+        self._loaded_at = float("-inf")
+
+
+smtp_config_cache = SMTPConfigCache(
+    ttl_seconds=float(os.getenv("SMTP_CONFIG_CACHE_TTL_SECONDS", "60")),
+)
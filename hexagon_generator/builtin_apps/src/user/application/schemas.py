@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
@@ -24,10 +24,18 @@ class UpdateUserRequest(BaseModel):
     phone: Optional[str] = None
 
 
+class UserRoleResponse(BaseModel):
+    id: int
+    name: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class UserResponse(UserBase):
     id: int = Field(..., gt=0)
     is_active: bool
     is_new: bool
+    roles: Optional[list[UserRoleResponse]] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -37,6 +45,7 @@ class UserListResponse(BaseModel):
     name: str
     email: str
     is_active: bool
+    roles: Optional[list[UserRoleResponse]] = None
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -49,3 +58,4 @@ class FilterParams(BaseModel):
     email: Optional[str] = None
     name: Optional[str] = None
     is_active: Optional[bool] = None
+    include: list[Literal["roles"]] = Field(default_factory=list)
@@ -1,8 +1,8 @@
 import os
 
 import jwt
-from bcrypt import gensalt, hashpw
 
+from src.common.password_hasher import password_hasher
 from src.user.domain.repository import UserRepository
 from src.user.domain.entities import User, UpdateUserData
 from src.user.domain.unit_of_work import UnitOfWork
@@ -28,9 +28,7 @@ class ChangePasswordUseCase:
 
         user = await self.user_repository.get_by_id(id=user_id)
 
-        new_password = hashpw(
-            password.encode("utf-8"), gensalt()
-        ).decode("utf-8")
+        new_password = await password_hasher.hash(password)
         data = UpdateUserData(password=new_password)
         await self.user_repository.update(id=user.id, data=data)
 
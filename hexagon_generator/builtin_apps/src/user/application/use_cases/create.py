@@ -1,11 +1,11 @@
 import re
 
-from bcrypt import gensalt, hashpw
-
+from src.common.password_hasher import password_hasher
+from src.smtp.domain.repository import EmailOutboxRepository
 from src.user.domain.repository import UserRepository
 from src.user.domain.entities import User, CreateUserData
 from src.user.domain.unit_of_work import UnitOfWork
-from src.user.domain.exceptions import UserAlreadyExistException, InvalidPasswordException
+from src.user.domain.exceptions import InvalidPasswordException
 
 
 class CreateUseCase:
@@ -15,16 +15,19 @@ class CreateUseCase:
         unit_of_work: UnitOfWork,
         user_repository: UserRepository,
         roles: list[int] | None = None,
+        email_outbox: EmailOutboxRepository | None = None,
+        locale: str | None = None,
     ):
         self.unit_of_work = unit_of_work
         self.user_repository = user_repository
         self.roles = roles or []
+        self.email_outbox = email_outbox
+        self.locale = locale
 
     async def execute(self, *, data: CreateUserData) -> User:
         self._validate_password(data.password)
-        await self._check_email_unique(data.email)
 
-        data.password = self._hash_password(data.password)
+        data.password = await self._hash_password(data.password)
         user = await self.user_repository.create(data=data)
 
         if self.roles:
@@ -33,6 +36,14 @@ class CreateUseCase:
                 user_id=user.id, roles_ids=self.roles
             )
 
+        if self.email_outbox:
+            await self.email_outbox.enqueue(
+                recipients=[user.email],
+                template="welcome",
+                context={"name": user.name},
+                locale=self.locale,
+            )
+
         await self.unit_of_work.commit()
         return user
 
@@ -45,13 +56,6 @@ class CreateUseCase:
                 "Password does not meet the required criteria"
             )
 
-    async def _check_email_unique(self, email: str) -> None:
-        existing = await self.user_repository.get_by_email(email=email)
-        if existing:
-            raise UserAlreadyExistException(
-                f"User with email {email} already exists"
-            )
-
     @staticmethod
-    def _hash_password(password: str) -> str:
-        return hashpw(password.encode("utf-8"), gensalt()).decode("utf-8")
+    async def _hash_password(password: str) -> str:
+        return await password_hasher.hash(password)
@@ -4,8 +4,9 @@ import string
 from datetime import datetime, timedelta
 
 import jwt
-from bcrypt import gensalt, hashpw
 
+from src.common.password_hasher import password_hasher
+from src.smtp.domain.repository import EmailOutboxRepository
 from src.user.domain.repository import UserRepository
 from src.user.domain.entities import UpdateUserData
 from src.user.domain.unit_of_work import UnitOfWork
@@ -18,9 +19,15 @@ class ForgotPasswordUseCase:
         *,
         unit_of_work: UnitOfWork,
         user_repository: UserRepository,
+        email_outbox: EmailOutboxRepository,
+        frontend_url: str,
+        locale: str | None = None,
     ):
         self.unit_of_work = unit_of_work
         self.user_repository = user_repository
+        self.email_outbox = email_outbox
+        self.frontend_url = frontend_url
+        self.locale = locale
 
     async def execute(self, *, email: str) -> str:
         user = await self.user_repository.get_by_email(email=email)
@@ -28,9 +35,7 @@ class ForgotPasswordUseCase:
             raise UserNotFoundException(f"Usuario con correo {email} no existe")
 
         random_string = self._generate_random_string(length=16)
-        new_password = hashpw(
-            random_string.encode("utf-8"), gensalt()
-        ).decode("utf-8")
+        new_password = await password_hasher.hash(random_string)
 
         data = UpdateUserData(password=new_password)
         await self.user_repository.update(id=user.id, data=data)
@@ -38,6 +43,13 @@ class ForgotPasswordUseCase:
         token = self._create_token(
             data={"user": user.id, "new_password": new_password}
         )
+        reset_url = f"{self.frontend_url}/cambiar-contraseña?token={token}"
+        await self.email_outbox.enqueue(
+            recipients=[email],
+            template="reset_password",
+            context={"reset_url": reset_url},
+            locale=self.locale,
+        )
         await self.unit_of_work.commit()
         return token
 
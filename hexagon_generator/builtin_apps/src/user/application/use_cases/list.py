@@ -20,6 +20,7 @@ class ListUseCase:
             limit=filter_params.limit,
             order_by=filter_params.order_by,
             search=filter_params.search,
+            include=filter_params.include,
             email=filter_params.email,
             name=filter_params.name,
             is_active=filter_params.is_active,
@@ -1,3 +1,5 @@
+from typing import Collection
+
 from src.user.domain.repository import UserRepository
 from src.user.domain.entities import User
 from src.user.domain.unit_of_work import UnitOfWork
@@ -13,5 +15,5 @@ class RetrieveUseCase:
         self.unit_of_work = unit_of_work
         self.user_repository = user_repository
 
-    async def execute(self, *, user_id: int) -> User:
-        return await self.user_repository.get_by_id(id=user_id)
+    async def execute(self, *, user_id: int, include: Collection[str] = ()) -> User:
+        return await self.user_repository.get_by_id(id=user_id, include=include)
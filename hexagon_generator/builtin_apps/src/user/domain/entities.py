@@ -2,6 +2,12 @@ from dataclasses import dataclass
 from typing import Optional
 
 
+@dataclass
+class UserRole:
+    id: int
+    name: str
+
+
 @dataclass
 class User:
     id: int
@@ -11,6 +17,7 @@ class User:
     is_new: bool
     password: str
     phone: str
+    roles: Optional[list[UserRole]] = None
 
 
 @dataclass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from src.user.domain.entities import (
     User,
@@ -9,7 +10,7 @@ from src.user.domain.entities import (
 
 class UserRepository(ABC):
     @abstractmethod
-    async def get_by_id(self, *, id: int) -> User: ...
+    async def get_by_id(self, *, id: int, include: Collection[str] = ()) -> User: ...
 
     @abstractmethod
     async def get(
@@ -19,6 +20,7 @@ class UserRepository(ABC):
         limit: int = 10,
         order_by: str | None = None,
         search: str | None = None,
+        include: Collection[str] = (),
         **filters,
     ) -> tuple[list[User], int]: ...
 
@@ -1,11 +1,23 @@
 from dataclasses import asdict
+from typing import Collection
 
 from sqlalchemy import select, update, delete, func, or_, desc, asc
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-
+from sqlalchemy.orm import selectinload
+
+from src.auth.infrastructure.principal_cache import principal_cache
+from src.common.utils.db_errors import is_unique_violation
+from src.common.utils.dialect_insert import dialect_insert
+from src.common.utils.on_commit import run_after_commit
+from src.role.infrastructure.permission_resolver import (
+    USERS_VERSION,
+    bump_permission_version,
+    permission_resolver,
+)
 from src.user.domain.repository import UserRepository
-from src.user.domain.entities import User, CreateUserData, UpdateUserData
-from src.user.domain.exceptions import UserNotFoundException
+from src.user.domain.entities import User, UserRole, CreateUserData, UpdateUserData
+from src.user.domain.exceptions import UserAlreadyExistException, UserNotFoundException
 from src.user.infrastructure.models import UserORM, UserRoleAssociation
 from src.role.infrastructure.models import RoleORM
 
@@ -15,7 +27,10 @@ class ORMUserRepository(UserRepository):
         self.db = db
 
     @staticmethod
-    def _to_entity(orm_obj: UserORM) -> User:
+    def _to_entity(orm_obj: UserORM, *, with_roles: bool = False) -> User:
+        roles = None
+        if with_roles:
+            roles = [UserRole(id=r.id, name=r.name) for r in orm_obj.roles]
         return User(
             id=orm_obj.id,
             name=orm_obj.name,
@@ -24,17 +39,41 @@ class ORMUserRepository(UserRepository):
             is_new=orm_obj.is_new,
             password=orm_obj.password,
             phone=orm_obj.phone,
+            roles=roles,
         )
 
-    async def get_by_id(self, *, id: int) -> User:
-        stmt = select(UserORM).where(UserORM.id == id)
+    @staticmethod
+    def _include_options(include: Collection[str]) -> list:
+        # selectinload issues one extra "WHERE id IN (...)" query per page.
+        options = []
+        if "roles" in include:
+            options.append(selectinload(UserORM.roles))
+        return options
+
+    async def _invalidate_principal(self, user_id: int) -> None:
+        # Stateless tokens issued before the bump are re-checked against the
+        # database by every worker.
+        await bump_permission_version(self.db, USERS_VERSION)
+
+        def invalidate() -> None:
+            principal_cache.invalidate_user(user_id)
+            permission_resolver.invalidate()
+
+        run_after_commit(self.db, invalidate)
+
+    async def get_by_id(self, *, id: int, include: Collection[str] = ()) -> User:
+        stmt = (
+            select(UserORM)
+            .where(UserORM.id == id)
+            .options(*self._include_options(include))
+        )
         result = await self.db.execute(stmt)
         orm_obj = result.scalar_one_or_none()
 
         if not orm_obj:
             raise UserNotFoundException(f"User with ID {id} not found")
 
-        return self._to_entity(orm_obj)
+        return self._to_entity(orm_obj, with_roles="roles" in include)
 
     async def get(
         self,
@@ -43,6 +82,7 @@ class ORMUserRepository(UserRepository):
         limit: int = 10,
         order_by: str | None = None,
         search: str | None = None,
+        include: Collection[str] = (),
         **filters,
     ) -> tuple[list[User], int]:
         stmt = select(UserORM)
@@ -78,19 +118,21 @@ class ORMUserRepository(UserRepository):
         else:
             stmt = stmt.order_by(desc(UserORM.id))
 
-        stmt = stmt.offset(skip).limit(limit)
+        stmt = stmt.offset(skip).limit(limit).options(*self._include_options(include))
 
         result = await self.db.execute(stmt)
         orm_objects = result.scalars().all()
 
-        return [self._to_entity(obj) for obj in orm_objects], count
+        return [
+            self._to_entity(obj, with_roles="roles" in include) for obj in orm_objects
+        ], count
 
     async def create(self, *, data: CreateUserData) -> User:
         data_dict = asdict(data)
         orm_obj = UserORM(**data_dict)
 
         self.db.add(orm_obj)
-        await self.db.flush()
+        await self._flush_unique(email=data.email)
         await self.db.refresh(orm_obj)
 
         return self._to_entity(orm_obj)
@@ -104,8 +146,13 @@ class ORMUserRepository(UserRepository):
             return await self.get_by_id(id=id)
 
         stmt = update(UserORM).where(UserORM.id == id).values(**update_data)
-        await self.db.execute(stmt)
+        try:
+            await self.db.execute(stmt)
+        except IntegrityError as e:
+            self._raise_if_duplicate(e, email=update_data.get("email"))
+            raise
         await self.db.flush()
+        await self._invalidate_principal(id)
 
         return await self.get_by_id(id=id)
 
@@ -117,9 +164,26 @@ class ORMUserRepository(UserRepository):
         )
         await self.db.execute(delete(UserORM).where(UserORM.id == id))
         await self.db.flush()
+        await self._invalidate_principal(id)
 
         return entity
 
+    async def _flush_unique(self, *, email: str) -> None:
+        # The unique index on email is the single source of truth: no
+        # SELECT beforehand, and concurrent signups cannot both win.
+        try:
+            await self.db.flush()
+        except IntegrityError as e:
+            self._raise_if_duplicate(e, email=email)
+            raise
+
+    @staticmethod
+    def _raise_if_duplicate(exc: IntegrityError, *, email: str | None) -> None:
+        if is_unique_violation(exc):
+            raise UserAlreadyExistException(
+                f"User with email {email} already exists"
+            ) from exc
+
     async def get_by_email(self, *, email: str) -> User | None:
         stmt = select(UserORM).where(UserORM.email == email)
         result = await self.db.execute(stmt)
@@ -143,9 +207,35 @@ class ORMUserRepository(UserRepository):
     async def bulk_link_roles_to_user(
         self, *, user_id: int, roles_ids: list[int]
     ) -> None:
-        await self.db.execute(
-            delete(UserRoleAssociation).where(UserRoleAssociation.user_id == user_id)
+        result = await self.db.execute(
+            select(UserRoleAssociation.role_id).where(
+                UserRoleAssociation.user_id == user_id
+            )
         )
-        await self.db.flush()
-        for role_id in roles_ids:
-            self.db.add(UserRoleAssociation(role_id=role_id, user_id=user_id))
+        current = set(result.scalars().all())
+        desired = set(roles_ids)
+        to_remove = current - desired
+        to_add = desired - current
+        if not to_remove and not to_add:
+            return
+
+        if to_remove:
+            await self.db.execute(
+                delete(UserRoleAssociation).where(
+                    UserRoleAssociation.user_id == user_id,
+                    UserRoleAssociation.role_id.in_(to_remove),
+                )
+            )
+        if to_add:
+            # Sorted so concurrent edits take row locks in the same order.
+            await self.db.execute(
+                dialect_insert(self.db, UserRoleAssociation)
+                .values(
+                    [
+                        {"user_id": user_id, "role_id": role_id}
+                        for role_id in sorted(to_add)
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+        await self._invalidate_principal(user_id)
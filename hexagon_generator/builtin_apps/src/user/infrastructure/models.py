@@ -11,7 +11,7 @@ class UserRoleAssociation(Base):
         Integer, ForeignKey("User.id"), primary_key=True
     )
     role_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("Role.id"), primary_key=True
+        Integer, ForeignKey("Role.id"), primary_key=True, index=True
     )
 
 
@@ -20,7 +20,7 @@ class UserORM(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(Text, nullable=False)
-    email: Mapped[str] = mapped_column(Text, nullable=False)
+    email: Mapped[str] = mapped_column(Text, nullable=False, unique=True, index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_new: Mapped[bool] = mapped_column(Boolean, default=True)
     password: Mapped[str] = mapped_column(Text, nullable=False)
@@ -1,13 +1,15 @@
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, BackgroundTasks, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Header, Path, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies.get_user_with_permissions import get_user_with_permission
+from src.common.conditional_get import entity_etag, not_modified
 from src.common.database_connection import get_db
 from src.common.std_response import StandardResponse, std_response
 from src.config import settings
-from src.smtp.dependencies.send_email import send_email
+from src.smtp.infrastructure.database import ORMEmailOutboxRepository
+from src.smtp.utils.email_templates import email_templates
 from src.user.domain.entities import CreateUserData, UpdateUserData
 from src.user.application.schemas import (
     CreateUserRequest,
@@ -46,9 +48,16 @@ def get_unit_of_work(db: AsyncSession = Depends(get_db)) -> SQLAlchemyUnitOfWork
     return SQLAlchemyUnitOfWork(session=db)
 
 
+def get_email_outbox(db: AsyncSession = Depends(get_db)) -> ORMEmailOutboxRepository:
+    return ORMEmailOutboxRepository(db=db)
+
+
 Repository = Annotated[ORMUserRepository, Depends(get_repository)]
 UoW = Annotated[SQLAlchemyUnitOfWork, Depends(get_unit_of_work)]
+EmailOutbox = Annotated[ORMEmailOutboxRepository, Depends(get_email_outbox)]
+AcceptLanguage = Annotated[str | None, Header()]
 UserId = Annotated[int, Path(..., description="ID of the User", gt=0)]
+UserInclude = Annotated[list[Literal["roles"]], Query()]
 
 
 @router.post(
@@ -60,8 +69,8 @@ async def create_user(
     user_data: CreateUserRequest,
     repository: Repository,
     unit_of_work: UoW,
-    background_tasks: BackgroundTasks,
-    db: AsyncSession = Depends(get_db),
+    email_outbox: EmailOutbox,
+    accept_language: AcceptLanguage = None,
     # _=Depends(get_user_with_permission("user.create")),
 ):
     data = CreateUserData(
@@ -75,17 +84,10 @@ async def create_user(
         unit_of_work=unit_of_work,
         user_repository=repository,
         roles=user_data.roles,
+        email_outbox=email_outbox,
+        locale=email_templates.resolve_locale(accept_language),
     )
     result = await use_case.execute(data=data)
-
-    task_args = {
-        "db": db,
-        "email": result.email,
-        "subject": "Bienvenido a la plataforma",
-        "message": "Bienvenido a la plataforma",
-    }
-    background_tasks.add_task(send_email, **task_args)
-
     return std_response(data=result, status_code=status.HTTP_201_CREATED)
 
 
@@ -112,10 +114,15 @@ async def get_user(
     user_id: UserId,
     repository: Repository,
     unit_of_work: UoW,
+    request: Request,
+    response: Response,
+    include: UserInclude = [],
     _=Depends(get_user_with_permission("user.get")),
 ):
     use_case = RetrieveUseCase(unit_of_work=unit_of_work, user_repository=repository)
-    result = await use_case.execute(user_id=user_id)
+    result = await use_case.execute(user_id=user_id, include=include)
+    if cached := not_modified(request, response, etag=entity_etag(result)):
+        return cached
     return std_response(data=result)
 
 
@@ -165,29 +172,17 @@ async def forgot_password(
     email: str,
     repository: Repository,
     unit_of_work: UoW,
-    db: AsyncSession = Depends(get_db),
+    email_outbox: EmailOutbox,
+    accept_language: AcceptLanguage = None,
 ):
     use_case = ForgotPasswordUseCase(
         unit_of_work=unit_of_work,
         user_repository=repository,
+        email_outbox=email_outbox,
+        frontend_url=settings.frontend_url,
+        locale=email_templates.resolve_locale(accept_language),
     )
-    token = await use_case.execute(email=email)
-
-    msg = f"""
-        <a href='{settings.frontend_url}/cambiar-contraseña?token={token}' target='__blank'>
-            <h1>Haz click aqui para cambiar tu contraseña</h1>
-        </a>
-    """
-    task_args = {
-        "db": db,
-        "email": email,
-        "subject": "Cambio de contraseña",
-        "message": msg,
-    }
-    was_sent, msg = await send_email(**task_args)
-    if not was_sent:
-        return std_response(status_code=status.HTTP_400_BAD_REQUEST, ok=False, msg=msg)
-
+    await use_case.execute(email=email)
     return std_response()
 
 
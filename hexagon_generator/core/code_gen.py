@@ -24,6 +24,7 @@ class TemplateRenderer:
         pascal_case: str,
         snake_case: str,
         actions: Optional[List[str]] = None,
+        unique_fields: Optional[List[str]] = None,
     ):
         """
         Initialize TemplateRenderer.
@@ -32,10 +33,12 @@ class TemplateRenderer:
             pascal_case: Model name in PascalCase
             snake_case: Model name in snake_case
             actions: List of HTTP actions to generate
+            unique_fields: Fields backed by a unique index
         """
         self.pascal_case = pascal_case
         self.snake_case = snake_case
         self.actions = actions or []
+        self.unique_fields = unique_fields or []
 
     def render(self, template_content: str, **extra_context: Dict) -> str:
         """
@@ -54,6 +57,7 @@ class TemplateRenderer:
             "model_snake_case": self.snake_case,
             "model_pascal_case": self.pascal_case,
             "actions": self.actions,
+            "unique_fields": self.unique_fields,
             **extra_context,
         }
 
@@ -77,6 +81,7 @@ class CodeGenerator:
         snake_case: str,
         HTTP_ACTIONS: Optional[List[str]] = None,
         filepath: Optional[Union[str, Path]] = None,
+        unique_fields: Optional[List[str]] = None,
     ):
         """
         Initialize CodeGenerator.
@@ -86,6 +91,7 @@ class CodeGenerator:
             snake_case: Model name in snake_case
             HTTP_ACTIONS: List of HTTP actions (kept for backward compatibility)
             filepath: Optional file path for backward compatibility
+            unique_fields: Fields backed by a unique index
         """
         self.pascal_case = pascal_case
         self.snake_case = snake_case
@@ -97,6 +103,7 @@ class CodeGenerator:
             pascal_case=pascal_case,
             snake_case=snake_case,
             actions=self.HTTP_ACTIONS,
+            unique_fields=unique_fields,
         )
         self.file_handler = FileHandler()
 
@@ -122,7 +122,7 @@ class BuiltinAppsConfig:
     """Configuration for built-in applications."""
 
     available_apps: List[str] = field(
-        default_factory=lambda: ["user", "role", "auth", "smtp"]
+        default_factory=lambda: ["user", "role", "auth", "smtp", "loadtest"]
     )
 
     def is_valid_app(self, app_name: str) -> bool:
@@ -32,6 +32,7 @@ class GeneratorFactory:
     def create_crud_generator(
         model_name: str,
         actions: Optional[list[str]] = None,
+        unique_fields: Optional[list[str]] = None,
     ) -> ModelGenerator:
         """
         Create a CRUD model generator.
@@ -39,6 +40,7 @@ class GeneratorFactory:
         Args:
             model_name: Model name (can be PascalCase or snake_case)
             actions: Optional list of CRUD actions (defaults to all)
+            unique_fields: Optional list of fields backed by a unique index
 
         Returns:
             Configured ModelGenerator instance
@@ -69,6 +71,7 @@ class GeneratorFactory:
             pascal_case=pascal_case,
             snake_case=snake_case,
             HTTP_ACTIONS=actions,
+            unique_fields=unique_fields,
         )
 
         # Get templates from config
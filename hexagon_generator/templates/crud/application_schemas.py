@@ -10,7 +10,11 @@ class {{ model_pascal_case }}Base(BaseModel):
     # Example:
     # name: str = Field(..., min_length=1, max_length=100, description="Name of the {{ model_pascal_case }}")
     # description: Optional[str] = Field(None, max_length=500, description="Description")
+{%- for field in unique_fields %}
+    {{ field }}: str = Field(..., min_length=1, max_length=255, description="Unique {{ field }}")
+{%- else %}
     pass
+{%- endfor %}
 
 
 class Create{{ model_pascal_case }}Request({{ model_pascal_case }}Base):
@@ -33,6 +37,9 @@ class Update{{ model_pascal_case }}Request(BaseModel):
     # Example:
     # name: Optional[str] = Field(None, min_length=1, max_length=100)
     # description: Optional[str] = Field(None, max_length=500)
+{%- for field in unique_fields %}
+    {{ field }}: Optional[str] = Field(None, min_length=1, max_length=255)
+{%- endfor %}
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -12,6 +12,9 @@ class {{ model_pascal_case }}:
     # Example:
     # name: str
     # description: Optional[str]
+{%- for field in unique_fields %}
+    {{ field }}: str
+{%- endfor %}
     created_at: datetime
     updated_at: datetime
 
@@ -23,7 +26,11 @@ class Create{{ model_pascal_case }}Data:
     # Example:
     # name: str
     # description: Optional[str] = None
+{%- for field in unique_fields %}
+    {{ field }}: str
+{%- else %}
     pass
+{%- endfor %}
 
 
 @dataclass
@@ -33,5 +40,9 @@ class Update{{ model_pascal_case }}Data:
     # Example:
     # name: Optional[str] = None
     # description: Optional[str] = None
+{%- for field in unique_fields %}
+    {{ field }}: Optional[str] = None
+{%- else %}
     pass
+{%- endfor %}
 """
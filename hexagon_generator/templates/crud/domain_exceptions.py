@@ -3,4 +3,10 @@ DOMAIN_EXCEPTIONS_TEMPLATE = """
 
 class {{ model_pascal_case }}NotFoundException(Exception):
     pass
+{%- if unique_fields %}
+
+
+class {{ model_pascal_case }}AlreadyExistsException(Exception):
+    pass
+{%- endif %}
 """
@@ -1,15 +1,19 @@
 INFRASTRUCTURE_DATABASE_TEMPLATE = """
 from dataclasses import asdict
 from sqlalchemy import select, update, delete, func, or_, desc, asc
+{%- if unique_fields %}
+from sqlalchemy.exc import IntegrityError
+{%- endif %}
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.{{ model_snake_case }}.domain.repository import {{ model_pascal_case }}Repository
+{% if unique_fields %}from src.common.utils.db_errors import is_unique_violation
+{% endif %}from src.{{ model_snake_case }}.domain.repository import {{ model_pascal_case }}Repository
 from src.{{ model_snake_case }}.domain.entities import (
     {{ model_pascal_case }},
     Create{{ model_pascal_case }}Data,
     Update{{ model_pascal_case }}Data,
 )
-from src.{{ model_snake_case }}.domain.exceptions import {{ model_pascal_case }}NotFoundException
+from src.{{ model_snake_case }}.domain.exceptions import {{ model_pascal_case }}NotFoundException{% if unique_fields %}, {{ model_pascal_case }}AlreadyExistsException{% endif %}
 from src.{{ model_snake_case }}.infrastructure.models import {{ model_pascal_case }}ORM
 
 
@@ -26,6 +30,9 @@ class ORM{{ model_pascal_case }}Repository({{ model_pascal_case }}Repository):
             id=orm_obj.id,
             # TODO: Map your fields here
             # name=orm_obj.name,
+{%- for field in unique_fields %}
+            {{ field }}=orm_obj.{{ field }},
+{%- endfor %}
             created_at=orm_obj.created_at,
             updated_at=orm_obj.updated_at,
         )
@@ -91,7 +98,17 @@ class ORM{{ model_pascal_case }}Repository({{ model_pascal_case }}Repository):
         orm_obj = {{ model_pascal_case }}ORM(**data_dict)
 
         self.db.add(orm_obj)
+{%- if unique_fields %}
+        # Let the unique index reject duplicates instead of checking first:
+        # a pre-check costs a query and still races concurrent inserts.
+        try:
+            await self.db.flush()
+        except IntegrityError as e:
+            self._raise_if_duplicate(e)
+            raise
+{%- else %}
         await self.db.flush()
+{%- endif %}
         await self.db.refresh(orm_obj)
 
         return self._to_entity(orm_obj)
@@ -109,7 +126,15 @@ class ORM{{ model_pascal_case }}Repository({{ model_pascal_case }}Repository):
             .where({{ model_pascal_case }}ORM.id == id)
             .values(**update_data)
         )
+{%- if unique_fields %}
+        try:
+            await self.db.execute(stmt)
+        except IntegrityError as e:
+            self._raise_if_duplicate(e)
+            raise
+{%- else %}
         await self.db.execute(stmt)
+{%- endif %}
         await self.db.flush()
 
         return await self.get_by_id(id=id)
@@ -122,4 +147,13 @@ class ORM{{ model_pascal_case }}Repository({{ model_pascal_case }}Repository):
         await self.db.flush()
 
         return entity
+{%- if unique_fields %}
+
+    @staticmethod
+    def _raise_if_duplicate(exc: IntegrityError) -> None:
+        if is_unique_violation(exc):
+            raise {{ model_pascal_case }}AlreadyExistsException(
+                "{{ model_pascal_case }} with the same {{ unique_fields | join(', ') }} already exists"
+            ) from exc
+{%- endif %}
 """
@@ -2,7 +2,7 @@ INFRASTRUCTURE_EXCEPTION_HANDLERS_TEMPLATE = """
 from fastapi import Request, status
 
 from src.common.std_response import std_response
-from src.{{ model_snake_case }}.domain.exceptions import {{ model_pascal_case }}NotFoundException
+from src.{{ model_snake_case }}.domain.exceptions import {{ model_pascal_case }}NotFoundException{% if unique_fields %}, {{ model_pascal_case }}AlreadyExistsException{% endif %}
 
 
 async def {{ model_snake_case }}_not_found_handler(request: Request, exc: {{ model_pascal_case }}NotFoundException):
@@ -12,9 +12,23 @@ async def {{ model_snake_case }}_not_found_handler(request: Request, exc: {{ mod
         msg=str(exc),
         data=None,
     )
+{%- if unique_fields %}
+
+
+async def {{ model_snake_case }}_already_exists_handler(request: Request, exc: {{ model_pascal_case }}AlreadyExistsException):
+    return std_response(
+        status_code=status.HTTP_409_CONFLICT,
+        ok=False,
+        msg=str(exc),
+        data=None,
+    )
+{%- endif %}
 
 
 EXCEPTIONS_{{ model_pascal_case.upper() }}_MAPPING = [
     ({{ model_snake_case }}_not_found_handler, {{ model_pascal_case }}NotFoundException),
+{%- if unique_fields %}
+    ({{ model_snake_case }}_already_exists_handler, {{ model_pascal_case }}AlreadyExistsException),
+{%- endif %}
 ]
 """
@@ -1,7 +1,7 @@
 INFRASTRUCTURE_MODELS_TEMPLATE = """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import Integer, Text, String, DateTime, func
+from sqlalchemy import ForeignKey, Integer, Text, String, DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.common.database_connection import Base
@@ -20,9 +20,24 @@ class {{ model_pascal_case }}ORM(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
     # TODO: Add your model columns here
+    # Index every column you filter, look up or join on; make natural keys
+    # unique so the database enforces them.
     # Example:
     # name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    # code: Mapped[str] = mapped_column(
+    #     String(50), nullable=False, unique=True, index=True
+    # )
+    # owner_id: Mapped[int] = mapped_column(
+    #     Integer, ForeignKey("User.id"), nullable=False, index=True
+    # )
     # description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+{%- if unique_fields %}
+{% for field in unique_fields %}
+    {{ field }}: Mapped[str] = mapped_column(
+        String(255), nullable=False, unique=True, index=True
+    )
+{%- endfor %}
+{%- endif %}
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -1,9 +1,10 @@
 INFRASTRUCTURE_WEB_TEMPLATE = """
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.common.conditional_get import entity_etag, not_modified
 from src.common.std_response import std_response, StandardResponse
 from src.common.database_connection import get_db
 from src.{{ model_snake_case }}.domain.entities import (
@@ -83,9 +84,16 @@ async def list_{{ model_snake_case }}s(
     filter_params: Annotated[FilterParams, Query()],
     repository: Repository,
     unit_of_work: UoW,
+    request: Request,
+    response: Response,
 ) -> StandardResponse[list[{{ model_pascal_case }}ListResponse]]:
     use_case = ListUseCase(unit_of_work=unit_of_work, {{ model_snake_case }}_repository=repository)
     result, count = await use_case.execute(filter_params=filter_params)
+    # No Last-Modified: a delete can shift older rows into the page without
+    # changing any updated_at, while ids + updated_at + count always change.
+    etag = entity_etag(count, [(item.id, item.updated_at) for item in result])
+    if cached := not_modified(request, response, etag=etag):
+        return cached
     return std_response(data=result, count=count)
 
 
@@ -97,6 +105,7 @@ async def list_{{ model_snake_case }}s(
     summary="Get {{ model_pascal_case }} by ID",
     responses={
         200: {"description": "{{ model_pascal_case }} found"},
+        304: {"description": "{{ model_pascal_case }} not modified since the client's copy"},
         404: {"description": "{{ model_pascal_case }} not found"},
     },
 )
@@ -104,9 +113,19 @@ async def get_{{ model_snake_case }}(
     {{ model_snake_case }}_id: {{ model_pascal_case }}Id,
     repository: Repository,
     unit_of_work: UoW,
+    request: Request,
+    response: Response,
 ) -> StandardResponse[{{ model_pascal_case }}Response]:
     use_case = RetrieveUseCase(unit_of_work=unit_of_work, {{ model_snake_case }}_repository=repository)
     result = await use_case.execute({{ model_snake_case }}_id={{ model_snake_case }}_id)
+    cached = not_modified(
+        request,
+        response,
+        etag=entity_etag(result.id, result.updated_at),
+        last_modified=result.updated_at,
+    )
+    if cached:
+        return cached
     return std_response(data=result)
 
 